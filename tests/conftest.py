@@ -5,10 +5,12 @@ import shutil
 from pathlib import Path
 from typing import Callable
 
+import numpy as np
 import pytest
 from _pytest.tmpdir import TempPathFactory
 
 from tiatoolbox.data import _fetch_remote_sample
+from tiatoolbox.utils.misc import imread
 
 
 @pytest.fixture(scope="session")
@@ -421,3 +423,39 @@ def moving_mask(remote_sample) -> pathlib.Path:
     Download moving mask for pytest.
     """
     return remote_sample("moving_mask")
+
+
+@pytest.fixture(scope="module")
+def fixed_image_arr(fixed_image) -> np.ndarray:
+    """Sample pytest fixture for the decoded fixed image.
+
+    Read the fixed image once per test module.
+    """
+    return imread(fixed_image)
+
+
+@pytest.fixture(scope="module")
+def moving_image_arr(moving_image) -> np.ndarray:
+    """Sample pytest fixture for the decoded moving image.
+
+    Read the moving image once per test module.
+    """
+    return imread(moving_image)
+
+
+@pytest.fixture(scope="module")
+def fixed_mask_arr(fixed_mask) -> np.ndarray:
+    """Sample pytest fixture for the decoded fixed mask.
+
+    Read the fixed mask once per test module.
+    """
+    return imread(fixed_mask)
+
+
+@pytest.fixture(scope="module")
+def moving_mask_arr(moving_mask) -> np.ndarray:
+    """Sample pytest fixture for the decoded moving mask.
+
+    Read the moving mask once per test module.
+    """
+    return imread(moving_mask)
@@ -28,6 +28,12 @@ def test_all():
     )
     assert np.sum(_output - output) == 0
 
+    layer = UpSample2x(inference_only=True)
+    output = layer(batch.requires_grad_())
+    assert not output.requires_grad
+    output = output.permute(0, 2, 3, 1)[0].numpy()
+    assert np.sum(_output - output) == 0
+
     #
     with pytest.raises(ValueError, match=r".*Unknown.*format.*"):
         centre_crop(_output[None, :, :, None], [2, 2], "NHWCT")
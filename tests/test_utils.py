@@ -98,6 +98,22 @@ def test_imresize_1x1():
     assert resized_img.shape == (10, 10, 3)
 
 
+def test_imresize_strided_uint8():
+    """Test imresize keeps uint8 for a strided view of an image."""
+    img = np.random.randint(0, 256, (20, 20, 3), dtype=np.uint8)
+    view = img[::2, ::2]
+    resized_img = utils.transforms.imresize(
+        view, output_size=(5, 5), interpolation="nearest"
+    )
+    assert resized_img.dtype == np.uint8
+    assert np.array_equal(
+        resized_img,
+        utils.transforms.imresize(
+            view.copy(), output_size=(5, 5), interpolation="nearest"
+        ),
+    )
+
+
 def test_imresize_no_scale_factor():
     """Test for imresize with no scale_factor given."""
     img = np.zeros((2000, 1000, 3))
@@ -320,6 +336,77 @@ def test_fuzz_safe_padded_read():
         assert all(np.array(region.shape) == 16 + 2 * padding)
 
 
+def test_fuzz_safe_padded_read_output_shape():
+    """Fuzz test safe_padded_read output outside the image."""
+    random.seed(0)
+    data = np.random.randint(1, 255, (16, 16))
+    # Reference image padded far enough to contain all of the reads
+    padded_data = np.pad(data, 64)
+    for _ in range(1000):
+        loc = np.random.randint(-32, 48, 2)
+        size = np.random.randint(1, 16, 2)
+        bounds = locsize2bounds(loc, size)
+        stride = np.random.randint(1, 4)
+        padding = np.random.randint(0, 4)
+        region = utils.image.safe_padded_read(
+            data, bounds, stride=stride, padding=padding
+        )
+        # Same shape as if the padded bounds were within the image
+        expected_shape = np.ceil((size[::-1] + 2 * padding) / stride)
+        assert np.array_equal(region.shape, expected_shape)
+        # Same values as reading from the zero padded image
+        padded_bounds = np.add(bounds, np.array([-1, -1, 1, 1]) * padding)
+        left, top, right, bottom = padded_bounds + 64
+        expected = padded_data[top:bottom:stride, left:right:stride]
+        assert np.array_equal(region, expected)
+
+
+def test_safe_padded_read_strided_non_constant():
+    """Test strided safe_padded_read with a non-constant pad mode."""
+    data = np.random.randint(1, 255, (24, 20, 3), dtype=np.uint8)
+    # No strided samples of the padded bounds lie inside the image
+    region = utils.image.safe_padded_read(
+        data, (-5, 25, -1, 37), stride=2, padding=2, pad_mode="symmetric"
+    )
+    assert region.shape == (8, 4, 3)
+    # Strided samples inside the image are read, not padded
+    region = utils.image.safe_padded_read(
+        data, (-3, -3, 9, 9), stride=2, padding=2, pad_mode="symmetric"
+    )
+    assert region.shape == (8, 8, 3)
+    assert np.array_equal(region[3:, 3:], data[1:11:2, 1:11:2])
+
+
+def test_safe_padded_read_out():
+    """Test safe_padded_read writing to an output buffer."""
+    data = np.random.randint(0, 255, (16, 16, 3), dtype=np.uint8)
+    out = np.empty((8, 8, 3), dtype=np.uint8)
+    for bounds in [(0, 0, 8, 8), (-4, -4, 4, 4), (12, 12, 20, 20)]:
+        for pad_mode in ["constant", "reflect"]:
+            expected = utils.image.safe_padded_read(data, bounds, pad_mode=pad_mode)
+            region = utils.image.safe_padded_read(
+                data, bounds, pad_mode=pad_mode, out=out
+            )
+            assert region is out
+            assert np.array_equal(out, expected)
+
+    with pytest.raises(ValueError, match="Output buffer"):
+        utils.image.safe_padded_read(data, (-4, -4, 4, 4), out=out[:4])
+    with pytest.raises(ValueError, match="Output buffer"):
+        utils.image.safe_padded_read(data, (0, 0, 8, 8), out=out.astype(float))
+
+
+def test_safe_padded_read_wide_padding():
+    """Test safe_padded_read with padding wider than the region read."""
+    data = np.random.randint(0, 255, (4, 5, 3), dtype=np.uint8)
+    for pad_mode in ["reflect", "symmetric", "wrap", "edge"]:
+        region = utils.image.safe_padded_read(
+            data, (0, 0, 5, 4), padding=6, pad_mode=pad_mode
+        )
+        expected = np.pad(data, ((6, 6), (6, 6), (0, 0)), mode=pad_mode)
+        assert np.array_equal(region, expected)
+
+
 def test_safe_padded_read_padding_shape():
     """Test safe_padded_read for invalid padding shape."""
     data = np.zeros((16, 16))
@@ -565,6 +652,20 @@ def test_sub_pixel_read_negative_size_bounds(source_image):
     assert np.all(np.fliplr(np.flipud(flipped_output)) == output)
 
 
+def test_sub_pixel_read_negative_width_or_height():
+    """Test sub_pixel_read flips along the correct axis."""
+    image = np.arange(100, dtype=np.uint8).reshape(10, 10)
+    output = utils.image.sub_pixel_read(image, (0, 0, 8, 8), (8, 8))
+
+    # Negative width flips horizontally
+    flipped_output = utils.image.sub_pixel_read(image, (8, 0, 0, 8), (8, 8))
+    assert np.array_equal(flipped_output, np.fliplr(output))
+
+    # Negative height flips vertically
+    flipped_output = utils.image.sub_pixel_read(image, (0, 8, 8, 0), (8, 8))
+    assert np.array_equal(flipped_output, np.flipud(output))
+
+
 def test_fuzz_sub_pixel_read(source_image):
     """Fuzz test for numpy sub-pixel image reads."""
     random.seed(0)
@@ -628,6 +729,29 @@ def test_sub_pixel_read_interpolation_modes():
         assert output.shape == out_size
 
 
+def test_sub_pixel_read_linear_ramp():
+    """Test sub_pixel_read samples a linear ramp at the output pixel centres."""
+    data = np.mgrid[:64, :64].astype(float)
+    data = data[1] + 2 * data[0]
+    bounds = (20.3, 16.8, 37.1, 29.5)
+    out_size = (23, 19)
+    output = utils.image.sub_pixel_read(data, bounds, out_size, interpolation="linear")
+    assert output.shape == out_size[::-1]
+    x = bounds[0] + (np.arange(out_size[0]) + 0.5) * (bounds[2] - bounds[0]) / 23
+    y = bounds[1] + (np.arange(out_size[1]) + 0.5) * (bounds[3] - bounds[1]) / 19
+    expected = (x - 0.5)[None] + 2 * (y - 0.5)[:, None]
+    assert np.abs(output - expected).mean() < 1
+
+
+def test_sub_pixel_read_unit_scale():
+    """Test sub_pixel_read with an output size equal to the bounds size."""
+    data = np.random.randint(0, 255, (16, 16, 3), dtype=np.uint8)
+    bounds = (2, 3, 10, 12)
+    for mode in ["nearest", "linear", "cubic"]:
+        output = utils.image.sub_pixel_read(data, bounds, (8, 9), interpolation=mode)
+        assert np.array_equal(output, data[3:12, 2:10])
+
+
 def test_sub_pixel_read_incorrect_read_func_return():
     """Test for sub pixel reading with incorrect read func return."""
     bounds = (0, 0, 8, 8)
@@ -676,6 +800,44 @@ def test_sub_pixel_read_empty_bounds():
         )
 
 
+def test_sub_pixel_read_batch():
+    """Test batch sub pixel reading matches reading each region."""
+    image = np.random.randint(0, 255, (32, 32, 3), dtype=np.uint8)
+    bounds = np.array(
+        [
+            [0, 0, 8, 8],
+            [-2.5, 3.25, 10, 12.5],
+            [20.5, 20.5, 40, 36],
+            [12, 12, 4, 4],
+        ]
+    )
+    output_sizes = np.array([[8, 8], [5, 7], [16, 12], [8, 8]])
+    for interpolation, pad_mode in [("nearest", "constant"), ("linear", "reflect")]:
+        regions = utils.image.sub_pixel_read_batch(
+            image,
+            bounds,
+            output_sizes,
+            padding=1,
+            interpolation=interpolation,
+            pad_mode=pad_mode,
+        )
+        assert len(regions) == len(bounds)
+        for region, bounds_i, output_size in zip(regions, bounds, output_sizes):
+            expected = utils.image.sub_pixel_read(
+                image,
+                bounds_i,
+                output_size,
+                padding=1,
+                interpolation=interpolation,
+                pad_mode=pad_mode,
+            )
+            assert np.array_equal(region, expected)
+
+    # A single output size is used for all regions
+    regions = utils.image.sub_pixel_read_batch(image, bounds, (6, 6))
+    assert all(region.shape == (6, 6, 3) for region in regions)
+
+
 def test_fuzz_bounds2locsize():
     """Fuzz test for bounds2size."""
     random.seed(0)
@@ -1041,6 +1203,20 @@ def test_make_bounds_size_positive():
     assert flipud is True
 
 
+def test_make_bounds_size_positive_batch():
+    """Test the batched make_bounds_size_positive matches each row."""
+    bounds = np.array(
+        [(0, 0, 10, 10), (0, 0, -10, 10), (0, 0, 10, -10), (0, 0, -10, -10)]
+    )
+    pos_bounds, fliplr, flipud = utils.image._make_bounds_size_positive_batch(bounds)
+    assert pos_bounds.shape == (4, 4)
+    for row, pos_row, fliplr_row, flipud_row in zip(bounds, pos_bounds, fliplr, flipud):
+        expected = utils.image.make_bounds_size_positive(row)
+        assert np.array_equal(pos_row, expected[0])
+        assert fliplr_row == expected[1]
+        assert flipud_row == expected[2]
+
+
 def test_crop_and_pad_edges():
     """Test crop and pad util function."""
     slide_dimensions = (1024, 1024)
@@ -1151,6 +1327,25 @@ def test_fuzz_crop_and_pad_edges_output_size_no_padding():
         assert output.shape == expected
 
 
+def test_crop_and_pad_edges_outside_slide():
+    """Test crop and pad util function with bounds outside of the slide."""
+    region = np.ones((10, 10))
+    for bounds in [
+        (-30, 0, -20, 10),
+        (0, -30, 10, -20),
+        (-30, -30, -20, -20),
+        (50, 50, 60, 60),
+    ]:
+        output = utils.image.crop_and_pad_edges(
+            bounds=bounds,
+            max_dimensions=(20, 20),
+            region=region,
+            pad_mode="constant",
+        )
+        assert output.shape == (10, 10)
+        assert np.all(output == 0)
+
+
 def test_crop_and_pad_edges_negative_max_dims():
     """Test crop and pad edges for negative max dims."""
     for max_dims in [(-1, 1), (1, -1), (-1, -1)]:
@@ -1198,6 +1393,35 @@ def test_normalize_padding_input_dims():
         utils.image.normalize_padding_size(((0, 0), (0, 0)))
 
 
+def test_normalize_padding_size():
+    """Test normalize padding with the different input formats."""
+    for padding, expected in [
+        (1, [1, 1, 1, 1]),
+        ((1, 2), [1, 2, 1, 2]),
+        ([1, 2, 3, 4], [1, 2, 3, 4]),
+        (np.array([1, 2]), [1, 2, 1, 2]),
+    ]:
+        output = utils.image.normalize_padding_size(padding)
+        assert np.array_equal(output, expected)
+        output = utils.image._normalize_padding_tuple(padding)
+        assert output == tuple(expected)
+
+    # Cached results must not be shared between calls
+    output = utils.image.normalize_padding_size((1, 2))
+    output += 1
+    assert np.array_equal(utils.image.normalize_padding_size([1, 2]), [1, 2, 1, 2])
+    # Equal padding with a different dtype must not share a cached result
+    output = utils.image.normalize_padding_size([1.0, 2.0])
+    assert output.dtype == np.float64
+    output = utils.image.normalize_padding_size(np.array([1, 2], dtype=np.int32))
+    assert output.dtype == np.int32
+
+    with pytest.raises(ValueError, match="invalid size 3"):
+        utils.image.normalize_padding_size((1, 2, 3))
+    with pytest.raises(ValueError, match="invalid size 3"):
+        utils.image._normalize_padding_tuple((1, 2, 3))
+
+
 def test_select_device():
     """Test if correct device is selected for models."""
     device = misc.select_device(on_gpu=True)
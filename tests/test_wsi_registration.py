@@ -1,22 +1,28 @@
-import pathlib
-
 import cv2
 import numpy as np
 import pytest
+import torch
 
 from tiatoolbox.tools.registration.wsi_registration import (
     DFBRegister,
+    _fast_warp_affine,
+    _match_cumulative_cdf,
+    _warped_mask_dice,
     match_histograms,
     prealignment,
+    warp_affine,
+    warp_affine_batch,
 )
-from tiatoolbox.utils.misc import imread
+from tiatoolbox.utils import env_detection as toolbox_env
+from tiatoolbox.utils.metrics import dice
 
+_DUMMY_IMAGE = np.zeros((256, 256), dtype=np.uint8)
+_DUMMY_MASK = np.eye(256, dtype=np.uint8)
 
-def test_extract_features(fixed_image, moving_image, dfbr_features):
-    """Test for CNN based feature extraction function."""
 
-    fixed_img = imread(fixed_image)
-    moving_img = imread(moving_image)
+def test_extract_features(fixed_image_arr, moving_image_arr, dfbr_features):
+    """Test for CNN based feature extraction function."""
+    fixed_img, moving_img = fixed_image_arr, moving_image_arr
 
     df = DFBRegister()
     with pytest.raises(
@@ -32,15 +38,8 @@ def test_extract_features(fixed_image, moving_image, dfbr_features):
     ):
         _ = df.extract_features(fixed_img, moving_img)
 
-    fixed_img = np.repeat(
-        np.expand_dims(
-            np.repeat(
-                np.expand_dims(np.arange(0, 64, 1, dtype=np.uint8), axis=1), 64, axis=1
-            ),
-            axis=2,
-        ),
-        3,
-        axis=2,
+    fixed_img = np.ascontiguousarray(
+        np.broadcast_to(np.arange(64, dtype=np.uint8)[:, None, None], (64, 64, 3))
     )
     output = df.extract_features(fixed_img, fixed_img)
     pool3_feat = output["block3_pool"][0, :].detach().numpy()
@@ -54,14 +53,94 @@ def test_extract_features(fixed_image, moving_image, dfbr_features):
     assert np.mean(np.abs(pool4_feat - _pool4_feat)) < 1.0e-4
     assert np.mean(np.abs(pool5_feat - _pool5_feat)) < 1.0e-4
 
+    df = DFBRegister(mixed_precision=True)
+    output_bf16 = df.extract_features(fixed_img, fixed_img)
+    for layer_name, features in output.items():
+        assert output_bf16[layer_name].dtype == torch.float32
+        assert output_bf16[layer_name].shape == features.shape
+
+
+def test_extract_features_independent_outputs():
+    """Test feature extraction calls return independent outputs."""
+    image_a = np.random.randint(256, size=(64, 64, 3), dtype=np.uint8)
+    image_b = np.random.randint(256, size=(64, 64, 3), dtype=np.uint8)
+    output_a = DFBRegister().extract_features(image_a, image_a)
+    features_a = {name: feat.clone() for name, feat in output_a.items()}
+    output_b = DFBRegister().extract_features(image_b, image_b)
+
+    assert output_a is not output_b
+    for layer_name, features in features_a.items():
+        assert torch.equal(output_a[layer_name], features)
+        assert not torch.equal(output_b[layer_name], features)
+
+
+def test_extract_features_compile_fallback(monkeypatch):
+    """Test feature extraction only falls back to eager for compile errors."""
+    dynamo_exc = pytest.importorskip("torch._dynamo.exc")
+    image = np.random.randint(256, size=(64, 64, 3), dtype=np.uint8)
+    expected = DFBRegister().extract_features(image, image)
+    expected = {name: feat.clone() for name, feat in expected.items()}
+
+    def compile_raising(error):
+        """Make a torch.compile replacement which raises an error when run."""
+
+        def compile_model(_model, **_kwargs):
+            def compiled_model(_x):
+                raise error
+
+            return compiled_model
+
+        return compile_model
+
+    compile_error = dynamo_exc.TorchDynamoException("Compilation failed.")
+    monkeypatch.setattr(torch, "compile", compile_raising(compile_error))
+    output = DFBRegister(compile_model=True).extract_features(image, image)
+    for layer_name, features in expected.items():
+        assert torch.equal(output[layer_name], features)
+
+    monkeypatch.setattr(torch, "compile", compile_raising(ValueError("Bad input.")))
+    with pytest.raises(ValueError, match="Bad input"):
+        DFBRegister(compile_model=True).extract_features(image, image)
+
 
-def test_feature_mapping(fixed_image, moving_image, dfbr_features):
+def test_extract_features_cuda_graph_cpu():
+    """Test the CUDA graph option has no effect on CPU."""
+    image = np.random.randint(256, size=(64, 64, 3), dtype=np.uint8)
+    expected = DFBRegister().extract_features(image, image)
+    expected = {name: feat.clone() for name, feat in expected.items()}
+
+    df = DFBRegister(cuda_graph=True)
+    output = df.extract_features(image, image)
+    assert df._compiled_feature_extractor(torch.zeros(1)) is df.feature_extractor
+    for layer_name, features in expected.items():
+        assert torch.equal(output[layer_name], features)
+
+
+@pytest.mark.skipif(
+    toolbox_env.running_on_ci() or not toolbox_env.has_gpu(),
+    reason="Local test on machine with GPU.",
+)
+@pytest.mark.parametrize("cuda_graph", [False, True])
+def test_extract_features_gpu(cuda_graph):
+    """Test that feature extraction on GPU matches the CPU version."""
+    image = np.random.randint(256, size=(64, 64, 3), dtype=np.uint8)
+    output_cpu = DFBRegister().extract_features(image, image)
+    output_cpu = {name: feat.clone() for name, feat in output_cpu.items()}
+
+    df = DFBRegister(on_gpu=True, cuda_graph=cuda_graph)
+    for _ in range(2):
+        output_gpu = df.extract_features(image, image)
+        for layer_name, features in output_cpu.items():
+            error = output_gpu[layer_name].cpu().numpy() - features.numpy()
+            assert np.mean(np.abs(error)) < 1.0e-3
+
+
+def test_feature_mapping(fixed_image_arr, moving_image_arr):
     """Test for CNN based feature matching function."""
-    fixed_img = imread(fixed_image)
-    moving_img = imread(moving_image)
+    fixed_img = fixed_image_arr
     pre_transform = np.array([[-1, 0, 337.8], [0, -1, 767.7], [0, 0, 1]])
     moving_img = cv2.warpAffine(
-        moving_img, pre_transform[0:-1][:], fixed_img.shape[:2][::-1]
+        moving_image_arr, pre_transform[0:-1][:], fixed_img.shape[:2][::-1]
     )
 
     df = DFBRegister()
@@ -81,12 +160,12 @@ def test_feature_mapping(fixed_image, moving_image, dfbr_features):
         _, _, _ = df.feature_mapping(features)
 
 
-def test_prealignment(fixed_image, moving_image, fixed_mask, moving_mask):
+def test_prealignment(
+    fixed_image_arr, moving_image_arr, fixed_mask_arr, moving_mask_arr
+):
     """Test for prealignment of an image pair"""
-    fixed_img = imread(fixed_image)
-    moving_img = imread(moving_image)
-    fixed_mask = imread(fixed_mask)
-    moving_mask = imread(moving_mask)
+    fixed_img, moving_img = fixed_image_arr, moving_image_arr
+    fixed_mask, moving_mask = fixed_mask_arr, moving_mask_arr
 
     with pytest.raises(
         ValueError, match=r".*The input images should be grayscale images.*"
@@ -118,55 +197,45 @@ def test_prealignment(fixed_image, moving_image, fixed_mask, moving_mask):
     ):
         _ = prealignment(fixed_img, moving_img, moving_mask, fixed_mask)
 
-    with pytest.raises(
-        ValueError, match=r".*Please select the rotation step in between 10 and 20.*"
-    ):
-        _ = prealignment(
-            fixed_img, moving_img, fixed_mask, moving_mask, rotation_step=9
-        )
 
+@pytest.mark.parametrize("rotation_step", [9, 21])
+def test_rotation_step_range(rotation_step):
+    """Test if the value of rotation step is within the range"""
     with pytest.raises(
         ValueError, match=r".*Please select the rotation step in between 10 and 20.*"
     ):
         _ = prealignment(
-            fixed_img, moving_img, fixed_mask, moving_mask, rotation_step=21
+            _DUMMY_IMAGE,
+            _DUMMY_IMAGE,
+            _DUMMY_MASK,
+            _DUMMY_MASK,
+            rotation_step=rotation_step,
         )
 
 
-def test_dice_overlap_range():
-    """Test if the value of rotation step is within the range"""
-    fixed_img = np.random.randint(20, size=(256, 256))
-    moving_img = np.random.randint(20, size=(256, 256))
-    fixed_mask = np.random.randint(2, size=(256, 256))
-    moving_mask = np.random.randint(2, size=(256, 256))
-
-    with pytest.raises(
-        ValueError, match=r".*The dice_overlap should be in between 0 and 1.0.*"
-    ):
-        _ = prealignment(fixed_img, moving_img, fixed_mask, moving_mask, dice_overlap=2)
-
+@pytest.mark.parametrize("dice_overlap", [2, -1])
+def test_dice_overlap_range(dice_overlap):
+    """Test if the value of dice overlap is within the range"""
+    # The dice_overlap check happens before the image content is used;
+    # only the masks need both background and foreground.
     with pytest.raises(
         ValueError, match=r".*The dice_overlap should be in between 0 and 1.0.*"
     ):
         _ = prealignment(
-            fixed_img, moving_img, fixed_mask, moving_mask, dice_overlap=-1
+            _DUMMY_IMAGE,
+            _DUMMY_IMAGE,
+            _DUMMY_MASK,
+            _DUMMY_MASK,
+            dice_overlap=dice_overlap,
         )
 
 
-def test_warning(
-    fixed_image,
-    moving_image,
-    fixed_mask,
-    moving_mask,
-):
-    fixed_img = imread(pathlib.Path(fixed_image))
-    moving_img = imread(pathlib.Path(moving_image))
-    fixed_mask = imread(pathlib.Path(fixed_mask))
-    moving_mask = imread(pathlib.Path(moving_mask))
-    fixed_img, moving_img = fixed_img[:, :, 0], moving_img[:, :, 0]
+def test_warning(fixed_image_arr, moving_image_arr, fixed_mask_arr, moving_mask_arr):
+    """Test for the warning raised when no transformation is found."""
+    fixed_img, moving_img = fixed_image_arr[:, :, 0], moving_image_arr[:, :, 0]
     with pytest.warns(UserWarning):
         _ = prealignment(
-            fixed_img, moving_img, fixed_mask, moving_mask, dice_overlap=0.9
+            fixed_img, moving_img, fixed_mask_arr, moving_mask_arr, dice_overlap=0.9
         )
 
 
@@ -214,8 +283,127 @@ def test_match_histograms():
             [13, 17, 177, 76, 31],
             [111, 62, 31, 83, 16],
             [127, 86, 149, 212, 58],
-        ]
+        ],
+        dtype=np.uint8,
     )
     norm_image_a, norm_image_b = match_histograms(image_a, image_b)
-    assert np.all(norm_image_a == expected_output)
-    assert np.all(norm_image_b == image_b)
+    assert np.array_equal(norm_image_a, expected_output)
+    assert np.array_equal(norm_image_b, image_b)
+
+    # Integer images with a large range of values
+    expected_output = _match_cumulative_cdf(image_a, image_b) * 2**40
+    output = _match_cumulative_cdf(
+        image_a.astype(np.int64) << 40, image_b.astype(np.int64) << 40
+    )
+    assert np.array_equal(output, expected_output)
+
+
+def test_warp_affine():
+    """Test for warping images with an affine transformation."""
+    image = cv2.GaussianBlur(
+        np.random.randint(256, size=(120, 90, 3), dtype=np.uint8), (7, 7), 2
+    )
+    transform = np.array([[0.9, 0.2, 5.0], [-0.1, 1.1, -3.0], [0, 0, 1]])
+    expected = cv2.warpAffine(image, transform[0:-1][:], (100, 130))
+
+    output = warp_affine(image, transform, (100, 130))
+    assert output.shape == expected.shape
+    assert output.dtype == np.uint8
+    assert np.mean(np.abs(output.astype(float) - expected)) < 0.5
+
+    output = warp_affine(image[:, :, 0], transform, (100, 130))
+    assert output.shape == expected.shape[:2]
+    assert np.mean(np.abs(output.astype(float) - expected[:, :, 0])) < 0.5
+
+    output = warp_affine_batch(
+        np.stack([image, image]), np.stack([transform, np.eye(3)]), (90, 120)
+    )
+    assert output.shape == (2, 120, 90, 3)
+    assert np.all(output[1] == image)
+
+    # Views with negative strides, as accepted by cv2.warpAffine
+    flipped = image[::-1]
+    output = warp_affine(flipped, np.eye(3), (90, 120))
+    assert np.all(output == flipped)
+    output = warp_affine_batch(np.flip(image[None], axis=2), np.eye(3)[None], (90, 120))
+    assert np.all(output[0] == image[:, ::-1])
+
+    with pytest.raises(
+        ValueError, match=r".*number of images and transforms should be the same.*"
+    ):
+        _ = warp_affine_batch(np.stack([image, image]), transform[None], (90, 120))
+
+
+def test_fast_warp_affine():
+    """Test for warping images with flips and integer translations."""
+    image = np.random.randint(1, 256, size=(40, 30, 3), dtype=np.uint8)
+    for transform in [
+        [[1, 0, 0], [0, 1, 0]],
+        [[-1, 0, 29], [0, 1, -5]],
+        [[1, 0, 12], [0, -1, 60]],
+        [[-1, 0, 100], [0, -1, 3]],
+        [[0.5, 0, 0.2], [0, 1.5, 1]],
+    ]:
+        transform = np.array(transform, dtype=float)
+        expected = cv2.warpAffine(image, transform, (25, 50))
+        output = _fast_warp_affine(image, transform, (25, 50))
+        assert np.array_equal(output, expected)
+
+    output = _fast_warp_affine(image[:, :, :1], np.eye(3), (30, 40))
+    assert np.array_equal(output, image[:, :, 0])
+
+
+def test_warped_mask_dice():
+    """Test dice computation between a fixed mask and warped moving masks."""
+    fixed_mask = np.zeros((200, 150), dtype=np.uint8)
+    fixed_mask[50:150, 40:110] = 1
+    moving_mask = np.zeros((200, 150), dtype=np.uint8)
+    moving_mask[60:170, 30:100] = 1
+    transforms = np.array(
+        [
+            np.eye(3),
+            [[0, -1, 180], [1, 0, 20], [0, 0, 1]],
+            [[0.98, 0.17, -10], [-0.17, 0.98, 30], [0, 0, 1]],
+        ]
+    )
+
+    output = _warped_mask_dice(fixed_mask, moving_mask, transforms)
+    expected = [
+        dice(fixed_mask, cv2.warpAffine(moving_mask, transform[0:-1][:], (150, 200)))
+        for transform in transforms
+    ]
+    assert output.shape == (3,)
+    assert np.all(np.abs(output - expected) < 1.0e-2)
+
+    # No overlap rather than NaN when both masks are empty, e.g. when
+    # the moving mask is warped outside of the fixed image
+    empty_mask = np.zeros_like(fixed_mask)
+    output = _warped_mask_dice(empty_mask, empty_mask, transforms)
+    assert np.array_equal(output, [0, 0, 0])
+    transforms[0, 0, 2] = 500
+    output = _warped_mask_dice(empty_mask, moving_mask, transforms)
+    assert np.array_equal(output, [0, 0, 0])
+
+
+@pytest.mark.skipif(
+    toolbox_env.running_on_ci() or not toolbox_env.has_gpu(),
+    reason="Local test on machine with GPU.",
+)
+def test_warped_mask_dice_gpu():
+    """Test that batched dice computation on GPU matches the CPU version."""
+    fixed_mask = np.zeros((200, 150), dtype=np.uint8)
+    fixed_mask[50:150, 40:110] = 1
+    moving_mask = np.zeros((200, 150), dtype=np.uint8)
+    moving_mask[60:170, 30:100] = 1
+    transforms = np.array(
+        [
+            np.eye(3),
+            [[0, -1, 180], [1, 0, 20], [0, 0, 1]],
+            [[0.98, 0.17, -10], [-0.17, 0.98, 30], [0, 0, 1]],
+        ]
+    )
+
+    output_cpu = _warped_mask_dice(fixed_mask, moving_mask, transforms)
+    output_gpu = _warped_mask_dice(fixed_mask, moving_mask, transforms, on_gpu=True)
+    assert output_gpu.shape == (3,)
+    assert np.all(np.abs(output_cpu - output_gpu) < 1.0e-2)
@@ -6,6 +6,28 @@ from typing import Union
 import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F  # noqa: N812
+
+# Indices of the (height, width) axes for each supported data format.
+_SPATIAL_AXES = {"NCHW": (2, 3), "NHWC": (1, 2)}
+
+
+def _get_spatial_axes(data_format: str):
+    """Get the indices of the height and width axes for a data format.
+
+    Args:
+        data_format (str):
+            Either `"NCHW"` or `"NHWC"`.
+
+    Returns:
+        tuple:
+            Indices of the height and width axes.
+
+    """
+    try:
+        return _SPATIAL_AXES[data_format]
+    except KeyError:
+        raise ValueError(f"Unknown input format `{data_format}`.") from None
 
 
 def centre_crop(
@@ -29,17 +51,17 @@ def centre_crop(
             Cropped image.
 
     """
-    if data_format not in ["NCHW", "NHWC"]:
-        raise ValueError(f"Unknown input format `{data_format}`.")
+    h_axis, w_axis = _get_spatial_axes(data_format)
 
     crop_t = crop_shape[0] // 2
     crop_b = crop_shape[0] - crop_t
     crop_l = crop_shape[1] // 2
     crop_r = crop_shape[1] - crop_l
-    if data_format == "NCHW":
-        return img[:, :, crop_t:-crop_b, crop_l:-crop_r]
 
-    return img[:, crop_t:-crop_b, crop_l:-crop_r, :]
+    index = [slice(None)] * img.ndim
+    index[h_axis] = slice(crop_t, img.shape[h_axis] - crop_b)
+    index[w_axis] = slice(crop_l, img.shape[w_axis] - crop_r)
+    return img[tuple(index)]
 
 
 def centre_crop_to_shape(
@@ -66,15 +88,9 @@ def centre_crop_to_shape(
             Cropped image.
 
     """
-    if data_format not in ["NCHW", "NHWC"]:
-        raise ValueError(f"Unknown input format `{data_format}`.")
-
-    if data_format == "NCHW":
-        _, _, h1, w1 = x.shape
-        _, _, h2, w2 = y.shape
-    else:
-        _, h1, w1, _ = x.shape
-        _, h2, w2, _ = y.shape
+    h_axis, w_axis = _get_spatial_axes(data_format)
+    h1, w1 = x.shape[h_axis], x.shape[w_axis]
+    h2, w2 = y.shape[h_axis], y.shape[w_axis]
 
     if h1 <= h2 or w1 <= w2:
         raise ValueError(
@@ -84,27 +100,35 @@ def centre_crop_to_shape(
             )
         )
 
-    x_shape = x.shape
-    y_shape = y.shape
-    if data_format == "NCHW":
-        crop_shape = (x_shape[2] - y_shape[2], x_shape[3] - y_shape[3])
-    else:
-        crop_shape = (x_shape[1] - y_shape[1], x_shape[2] - y_shape[2])
-
-    return centre_crop(x, crop_shape, data_format)
+    crop_t = (h1 - h2) // 2
+    crop_l = (w1 - w2) // 2
+    index = [slice(None)] * x.ndim
+    index[h_axis] = slice(crop_t, crop_t + h2)
+    index[w_axis] = slice(crop_l, crop_l + w2)
+    return x[tuple(index)]
 
 
 class UpSample2x(nn.Module):
     """A layer to scale input by a factor of 2.
 
-    This layer uses Kronecker product underneath rather than the default
-    pytorch interpolation.
+    This layer uses nearest neighbour interpolation, which is
+    equivalent to taking the Kronecker product of each pixel with a
+    2x2 matrix of ones.
+
+    Args:
+        inference_only (bool):
+            Whether to upsample without recording the operation for
+            autograd. This avoids autograd bookkeeping when the layer
+            is called outside of :func:`torch.inference_mode`, but no
+            gradient flows through the layer, so it must be `False`
+            when training.
 
     """
 
-    def __init__(self):
+    def __init__(self, inference_only: bool = False):
         super().__init__()
-        # correct way to create constant within module
+        self.inference_only = inference_only
+        # kept so that existing checkpoints still load with `strict=True`
         self.register_buffer(
             "unpool_mat", torch.from_numpy(np.ones((2, 2), dtype="float32"))
         )
@@ -124,12 +148,7 @@ class UpSample2x(nn.Module):
                 NCHW.
 
         """
-        input_shape = list(x.shape)
-        # un-squeeze is the same as expand_dims
-        # permute is the same as transpose
-        # view is the same as reshape
-        x = x.unsqueeze(-1)  # bchwx1
-        mat = self.unpool_mat.unsqueeze(0)  # 1xshxsw
-        ret = torch.tensordot(x, mat, dims=1)  # bxcxhxwxshxsw
-        ret = ret.permute(0, 1, 2, 4, 3, 5)
-        return ret.reshape((-1, input_shape[1], input_shape[2] * 2, input_shape[3] * 2))
+        # keep the caller's grad mode unless only used for inference
+        grad_enabled = torch.is_grad_enabled() and not self.inference_only
+        with torch.set_grad_enabled(grad_enabled):
+            return F.interpolate(x, scale_factor=2.0, mode="nearest")
@@ -1,18 +1,263 @@
+import math
 import warnings
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
 
 import cv2
 import numpy as np
 import scipy.ndimage as ndi
 import torch
 import torchvision
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit, prange = None, range
+try:
+    from torch._dynamo.exc import TorchDynamoException
+except ImportError:  # pragma: no cover
+    # torch < 2.0 has no torch.compile, so there are no compile errors
+    TorchDynamoException = ()
 from skimage import exposure, filters
 from skimage.util import img_as_float
 
 from tiatoolbox.utils.metrics import dice
+from tiatoolbox.utils.misc import select_device
 from tiatoolbox.utils.transforms import imresize
 
 
+def _normalised_coordinates_matrix(size: Tuple[int, int]) -> np.ndarray:
+    """Matrix mapping pixel coordinates to normalised coordinates.
+
+    The normalised coordinates are in the range [-1, 1], as expected by
+    :func:`torch.nn.functional.grid_sample` with `align_corners=False`.
+
+    Args:
+        size (tuple(int)):
+            Size of the image in the form of `(width, height)`.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            A 3x3 transformation matrix.
+
+    """
+    width, height = size
+    return np.array(
+        [
+            [2.0 / width, 0, 1.0 / width - 1],
+            [0, 2.0 / height, 1.0 / height - 1],
+            [0, 0, 1],
+        ]
+    )
+
+
+def _axis_aligned_slices(
+    scale: int, translation: int, input_length: int, output_length: int
+) -> Tuple[slice, slice]:
+    """Slices for a flip and integer shift along one axis.
+
+    Args:
+        scale (int):
+            Either 1 or -1, where -1 flips the axis.
+        translation (int):
+            Integer shift along the axis.
+        input_length (int):
+            Length of the input along the axis.
+        output_length (int):
+            Length of the output along the axis.
+
+    Returns:
+        tuple:
+            - :py:obj:`slice` - Slice into the output.
+            - :py:obj:`slice` - Slice into the input, flipped if
+              `scale` is -1.
+
+    """
+    if scale == 1:
+        start, stop = max(0, translation), min(
+            output_length, input_length + translation
+        )
+        offset = -translation
+    else:
+        start = max(0, translation - input_length + 1)
+        stop = min(output_length, translation + 1)
+        offset = input_length - 1 - translation
+    stop = max(start, stop)
+    return slice(start, stop), slice(start + offset, stop + offset)
+
+
+def _fast_warp_affine(
+    image: np.ndarray, transform: np.ndarray, output_size: Tuple[int, int]
+) -> np.ndarray:
+    """Apply an affine transformation to an image.
+
+    Transformations made of axis flips and integer translations are
+    applied by slicing the image. Any other transformation is applied
+    with :func:`cv2.warpAffine`, and the result is the same in both
+    cases.
+
+    Args:
+        image (:class:`numpy.ndarray`):
+            An image of shape HxW or HxWxC.
+        transform (:class:`numpy.ndarray`):
+            A 2x3 or 3x3 transformation matrix.
+        output_size (tuple(int)):
+            Size of the warped image in the form of `(width, height)`.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            A warped image.
+
+    """
+    transform = np.asarray(transform, dtype=np.float64)[:2]
+    linear, translation = transform[:, :2], transform[:, 2]
+    if not (
+        np.all(np.abs(np.diag(linear)) == 1)
+        and linear[0, 1] == 0
+        and linear[1, 0] == 0
+        and np.all(translation == np.round(translation))
+    ):
+        return cv2.warpAffine(image, transform, tuple(output_size))
+
+    (scale_x, scale_y), (shift_x, shift_y) = np.diag(linear), translation
+    dst_x, src_x = _axis_aligned_slices(
+        int(scale_x), int(shift_x), image.shape[1], output_size[0]
+    )
+    dst_y, src_y = _axis_aligned_slices(
+        int(scale_y), int(shift_y), image.shape[0], output_size[1]
+    )
+    image = image[:: int(scale_y), :: int(scale_x)]
+    warped = np.zeros((output_size[1], output_size[0], *image.shape[2:]), image.dtype)
+    warped[dst_y, dst_x] = image[src_y, src_x]
+    # cv2.warpAffine drops a singleton channel axis
+    return warped[..., 0] if warped.ndim == 3 and warped.shape[2] == 1 else warped
+
+
+def _warp_affine_tensor(
+    x: torch.Tensor, transforms: np.ndarray, output_size: Tuple[int, int]
+) -> torch.Tensor:
+    """Apply an affine transformation to each image in a batch tensor.
+
+    Args:
+        x (torch.Tensor):
+            A batch of images in the shape of NCHW.
+        transforms (:class:`numpy.ndarray`):
+            A batch of N transformation matrices of shape Nx2x3 or Nx3x3.
+        output_size (tuple(int)):
+            Size of the warped images in the form of `(width, height)`.
+
+    Returns:
+        torch.Tensor:
+            A batch of warped images in the shape of NCHW.
+
+    """
+    to_input = _normalised_coordinates_matrix((x.shape[3], x.shape[2]))
+    from_output = np.linalg.inv(_normalised_coordinates_matrix(output_size))
+
+    # grid_sample expects the inverse mapping from output to input.
+    theta = np.empty((len(transforms), 2, 3))
+    for i, transform in enumerate(transforms):
+        transform = np.vstack([transform[:2], [0, 0, 1]])
+        theta[i] = (to_input @ np.linalg.inv(transform) @ from_output)[:2]
+
+    theta = torch.from_numpy(theta).to(x.device).type(x.dtype)
+    grid = torch.nn.functional.affine_grid(
+        theta,
+        [x.shape[0], x.shape[1], output_size[1], output_size[0]],
+        align_corners=False,
+    )
+    return torch.nn.functional.grid_sample(
+        x, grid, mode="bilinear", padding_mode="zeros", align_corners=False
+    )
+
+
+def warp_affine_batch(
+    images: np.ndarray,
+    transforms: np.ndarray,
+    output_size: Tuple[int, int],
+    on_gpu: bool = False,
+) -> np.ndarray:
+    """Apply an affine transformation to each image in a batch.
+
+    This is equivalent to calling :func:`cv2.warpAffine` with bilinear
+    interpolation and a constant (zero) border on each image, but warps
+    the whole batch with a single call to
+    :func:`torch.nn.functional.grid_sample`.
+
+    Args:
+        images (:class:`numpy.ndarray`):
+            A batch of images of shape NxHxW or NxHxWxC.
+        transforms (:class:`numpy.ndarray`):
+            A batch of N transformation matrices, one per image, of
+            shape Nx2x3 or Nx3x3.
+        output_size (tuple(int)):
+            Size of the warped images in the form of `(width, height)`.
+        on_gpu (bool):
+            Whether to warp the images on GPU.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            A batch of warped images with the same dtype as `images`.
+
+    """
+    # torch.from_numpy does not support negative strides, e.g. flipped views
+    images = np.ascontiguousarray(images)
+    transforms = np.asarray(transforms, dtype=np.float64)
+    if len(images) != len(transforms):
+        raise ValueError("The number of images and transforms should be the same.")
+
+    has_channels = images.ndim == 4
+    if not has_channels:
+        images = images[..., np.newaxis]
+
+    device = select_device(on_gpu)
+    x = torch.from_numpy(images).to(device).permute(0, 3, 1, 2).type(torch.float32)
+    warped = _warp_affine_tensor(x, transforms, output_size)
+    warped = warped.permute(0, 2, 3, 1).cpu().numpy()
+
+    if np.issubdtype(images.dtype, np.integer):
+        dtype_info = np.iinfo(images.dtype)
+        warped = np.clip(np.round(warped), dtype_info.min, dtype_info.max)
+    warped = warped.astype(images.dtype)
+
+    return warped if has_channels else warped[..., 0]
+
+
+def warp_affine(
+    image: np.ndarray,
+    transform: np.ndarray,
+    output_size: Tuple[int, int],
+    on_gpu: bool = False,
+) -> np.ndarray:
+    """Apply an affine transformation to an image.
+
+    This is equivalent to :func:`cv2.warpAffine` with bilinear
+    interpolation and a constant (zero) border. See
+    :func:`warp_affine_batch`.
+
+    Args:
+        image (:class:`numpy.ndarray`):
+            An image of shape HxW or HxWxC.
+        transform (:class:`numpy.ndarray`):
+            A 2x3 or 3x3 transformation matrix.
+        output_size (tuple(int)):
+            Size of the warped image in the form of `(width, height)`.
+        on_gpu (bool):
+            Whether to warp the image on GPU.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            A warped image with the same dtype as `image`.
+
+    """
+    return warp_affine_batch(
+        np.asarray(image)[np.newaxis],
+        np.asarray(transform)[np.newaxis],
+        output_size,
+        on_gpu,
+    )[0]
+
+
 def _check_dims(
     fixed_img: np.ndarray,
     moving_img: np.ndarray,
@@ -48,6 +293,237 @@ def _check_dims(
         raise ValueError("Mismatch of shape between image and its corresponding mask.")
 
 
+def _bilinear_sample(mask: np.ndarray, x: float, y: float) -> float:  # pragma: no cover
+    """Sample a mask at a point with bilinear interpolation.
+
+    Pixels outside the mask are zero, as with the constant border of
+    :func:`cv2.warpAffine`. This function is compiled with numba when
+    it is available.
+
+    Args:
+        mask (:class:`numpy.ndarray`):
+            A binary mask.
+        x (float):
+            Horizontal coordinate of the point.
+        y (float):
+            Vertical coordinate of the point.
+
+    Returns:
+        float:
+            Interpolated value of the mask at the point.
+
+    """
+    height, width = mask.shape
+    x0, y0 = math.floor(x), math.floor(y)
+    wx, wy = x - x0, y - y0
+
+    value = 0.0
+    if 0 <= y0 < height:
+        if 0 <= x0 < width:
+            value += (1 - wx) * (1 - wy) * mask[y0, x0]
+        if 0 <= x0 + 1 < width:
+            value += wx * (1 - wy) * mask[y0, x0 + 1]
+    if 0 <= y0 + 1 < height:
+        if 0 <= x0 < width:
+            value += (1 - wx) * wy * mask[y0 + 1, x0]
+        if 0 <= x0 + 1 < width:
+            value += wx * wy * mask[y0 + 1, x0 + 1]
+    return value
+
+
+def _foreground_bounds(
+    mask: np.ndarray,
+) -> Tuple[int, int, int, int]:  # pragma: no cover
+    """Bounding box of the foreground of a mask.
+
+    This function is compiled with numba when it is available.
+
+    Args:
+        mask (:class:`numpy.ndarray`):
+            A binary mask.
+
+    Returns:
+        tuple:
+            Bounds of the foreground in the form of `(min_x, min_y,
+            max_x, max_y)`, which are inclusive.
+
+    """
+    height, width = mask.shape
+    min_x, min_y, max_x, max_y = width, height, -1, -1
+    for y in range(height):
+        for x in range(width):
+            if mask[y, x]:
+                min_x, max_x = min(min_x, x), max(max_x, x)
+                min_y, max_y = min(min_y, y), max(max_y, y)
+    return min_x, min_y, max_x, max_y
+
+
+def _warped_mask_overlap(
+    fixed_mask: np.ndarray,
+    moving_mask: np.ndarray,
+    moving_bounds: Tuple[int, int, int, int],
+    inverse_transform: np.ndarray,
+) -> Tuple[int, int]:  # pragma: no cover
+    """Overlap between a fixed mask and a transformed moving mask.
+
+    This function is compiled with numba when it is available.
+
+    Args:
+        fixed_mask (:class:`numpy.ndarray`):
+            A binary tissue mask for the fixed image.
+        moving_mask (:class:`numpy.ndarray`):
+            A binary tissue mask for the moving image.
+        moving_bounds (tuple(int)):
+            Bounds of the moving foreground, see
+            :func:`_foreground_bounds`.
+        inverse_transform (:class:`numpy.ndarray`):
+            A 3x3 transformation matrix, mapping the fixed image
+            coordinates to the moving image coordinates.
+
+    Returns:
+        tuple:
+            - int - Number of pixels in both masks.
+            - int - Number of pixels in the transformed moving mask.
+
+    """
+    height, width = fixed_mask.shape
+    min_x, min_y, max_x, max_y = moving_bounds
+    intersection, warped_sum = 0, 0
+    for y in range(height):
+        # source coordinates of the first pixel in the row
+        row_x = inverse_transform[0, 1] * y + inverse_transform[0, 2]
+        row_y = inverse_transform[1, 1] * y + inverse_transform[1, 2]
+        for x in range(width):
+            src_x = row_x + inverse_transform[0, 0] * x
+            src_y = row_y + inverse_transform[1, 0] * x
+            # the interpolated moving mask is zero outside its foreground
+            if not (min_x - 1 < src_x < max_x + 1 and min_y - 1 < src_y < max_y + 1):
+                continue
+            if _bilinear_sample(moving_mask, src_x, src_y) >= 0.5:
+                warped_sum += 1
+                intersection += fixed_mask[y, x]
+    return intersection, warped_sum
+
+
+def _dice_over_transforms(
+    fixed_mask: np.ndarray, moving_mask: np.ndarray, inverse_transforms: np.ndarray
+) -> np.ndarray:  # pragma: no cover
+    """Dice overlap between a fixed mask and transformed moving masks.
+
+    Each transformed moving mask is computed one pixel at a time with
+    bilinear interpolation, as in :func:`cv2.warpAffine`, and is never
+    stored. This function is compiled with numba when it is available.
+
+    Args:
+        fixed_mask (:class:`numpy.ndarray`):
+            A binary tissue mask for the fixed image.
+        moving_mask (:class:`numpy.ndarray`):
+            A binary tissue mask for the moving image.
+        inverse_transforms (:class:`numpy.ndarray`):
+            A batch of N 3x3 transformation matrices, mapping the fixed
+            image coordinates to the moving image coordinates.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            An array of N dice overlaps, one per transform. The overlap
+            is 0 where both masks are empty.
+
+    """
+    height, width = fixed_mask.shape
+    fixed_sum = 0
+    for y in range(height):
+        for x in range(width):
+            fixed_sum += fixed_mask[y, x]
+    moving_bounds = _foreground_bounds(moving_mask)
+
+    dice_overlaps = np.empty(inverse_transforms.shape[0])
+    for k in prange(inverse_transforms.shape[0]):  # skipcq: PYL-E1133
+        intersection, warped_sum = _warped_mask_overlap(
+            fixed_mask, moving_mask, moving_bounds, inverse_transforms[k]
+        )
+        sum_masks = fixed_sum + warped_sum
+        dice_overlaps[k] = 2 * intersection / sum_masks if sum_masks > 0 else 0.0
+
+    return dice_overlaps
+
+
+if njit is not None:
+    # The helpers are compiled first, so that the kernel calls the
+    # compiled versions, and the per pixel helpers are compiled into it
+    _bilinear_sample = njit(cache=True, fastmath=True, inline="always")(
+        _bilinear_sample
+    )
+    _foreground_bounds = njit(cache=True)(_foreground_bounds)
+    _warped_mask_overlap = njit(cache=True, fastmath=True, inline="always")(
+        _warped_mask_overlap
+    )
+    _dice_over_transforms = njit(parallel=True, cache=True, fastmath=True)(
+        _dice_over_transforms
+    )
+
+
+def _warped_mask_dice(
+    fixed_mask: np.ndarray,
+    moving_mask: np.ndarray,
+    transforms: np.ndarray,
+    on_gpu: bool = False,
+) -> np.ndarray:
+    """Dice overlap between a fixed mask and transformed moving masks.
+
+    On GPU, the moving mask is warped with all the transforms in a
+    single batch. On CPU, the overlaps are computed by a numba kernel,
+    or with :func:`cv2.warpAffine` for each transform if numba is not
+    installed.
+
+    Args:
+        fixed_mask (:class:`numpy.ndarray`):
+            A binary tissue mask for the fixed image.
+        moving_mask (:class:`numpy.ndarray`):
+            A binary tissue mask for the moving image.
+        transforms (:class:`numpy.ndarray`):
+            A batch of N 3x3 transformation matrices.
+        on_gpu (bool):
+            Whether to warp the moving mask on GPU.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            An array of N dice overlaps, one per transform. The overlap
+            is 0 where both masks are empty, so that it is never
+            selected as the best transform.
+
+    """
+    if not on_gpu and njit is not None:
+        return _dice_over_transforms(
+            np.uint8(fixed_mask > 0),
+            np.uint8(moving_mask > 0),
+            np.linalg.inv(transforms),
+        )
+
+    if not on_gpu:  # pragma: no cover
+        # dice is NaN where both masks are empty
+        return np.nan_to_num(
+            [
+                dice(
+                    fixed_mask,
+                    _fast_warp_affine(moving_mask, transform, fixed_mask.shape[::-1]),
+                )
+                for transform in transforms
+            ]
+        )
+
+    device = select_device(on_gpu)
+    moving = torch.from_numpy(moving_mask).to(device).type(torch.float32)
+    moving = moving.expand(len(transforms), 1, *moving_mask.shape)
+    warped_moving_masks = (
+        _warp_affine_tensor(moving, transforms, fixed_mask.shape[::-1]) >= 0.5
+    )
+    fixed = torch.from_numpy(fixed_mask > 0).to(device)
+    intersection = torch.logical_and(warped_moving_masks, fixed).sum(dim=(1, 2, 3))
+    sum_masks = warped_moving_masks.sum(dim=(1, 2, 3)) + fixed.sum()
+    # The intersection is 0 where both masks are empty
+    return (2 * intersection / sum_masks.clamp(min=1)).cpu().numpy()
+
+
 def prealignment(
     fixed_img: np.ndarray,
     moving_img: np.ndarray,
@@ -55,6 +531,7 @@ def prealignment(
     moving_mask: np.ndarray,
     dice_overlap: float = 0.5,
     rotation_step: int = 10,
+    on_gpu: bool = False,
 ) -> np.ndarray:
     """Coarse registration of an image pair.
 
@@ -75,6 +552,8 @@ def prealignment(
             transformation matrix.
         rotation_step (int):
             Rotation_step defines an increment in the rotation angles.
+        on_gpu (bool):
+            Whether to evaluate the candidate rotations on GPU.
 
     Returns:
         :class:`numpy.ndarray`:
@@ -119,7 +598,6 @@ def prealignment(
     origin_transform_com_ = [[1, 0, -fixed_com[0]], [0, 1, -fixed_com[1]], [0, 0, 1]]
     origin_transform_com = [[1, 0, fixed_com[0]], [0, 1, fixed_com[1]], [0, 0, 1]]
 
-    all_dice = []
     all_transform = []
     for angle in np.arange(0, 360, rotation_step).tolist():
         theta = np.radians(angle)
@@ -132,16 +610,15 @@ def prealignment(
             ),
             com_transform,
         )
-        warped_moving_mask = cv2.warpAffine(
-            moving_mask, transform[0:-1][:], fixed_img.shape[:2][::-1]
-        )
-        dice_com = dice(fixed_mask, warped_moving_mask)
-
-        all_dice.append(dice_com)
         all_transform.append(transform)
 
-    if max(all_dice) >= dice_overlap:
-        return all_transform[all_dice.index(max(all_dice))]
+    all_dice = _warped_mask_dice(
+        fixed_mask, moving_mask, np.array(all_transform), on_gpu=on_gpu
+    )
+
+    best_index = int(np.argmax(all_dice))
+    if all_dice[best_index] >= dice_overlap:
+        return all_transform[best_index]
 
     warnings.warn(
         "Not able to find the best transformation. Try changing the values for"
@@ -150,6 +627,48 @@ def prealignment(
     return None
 
 
+def _match_cumulative_cdf(source: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """Match the cumulative histogram of an image to that of a template.
+
+    This gives the same result as :func:`skimage.exposure.match_histograms`
+    for a single channel image. For uint8 and uint16 images, the
+    histograms are computed with :func:`numpy.bincount` and the result
+    is applied as a lookup table, avoiding sorting the pixel values.
+    Other dtypes may have a very large range of values, so they are
+    histogrammed with :func:`numpy.unique` instead.
+
+    Args:
+        source (:class:`numpy.ndarray`):
+            A grayscale image to be transformed.
+        template (:class:`numpy.ndarray`):
+            A grayscale template image.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            The transformed source image.
+
+    """
+    source_flat, template_flat = source.ravel(), template.ravel()
+    bincount_dtypes = (np.uint8, np.uint16)
+    if source.dtype in bincount_dtypes and template.dtype in bincount_dtypes:
+        source_lookup = source_flat
+        source_counts = np.bincount(source_flat)
+        template_counts = np.bincount(template_flat)
+        # omit the values which are not present in the template
+        template_values = np.nonzero(template_counts)[0]
+        template_counts = template_counts[template_values]
+    else:
+        _, source_lookup, source_counts = np.unique(
+            source_flat, return_inverse=True, return_counts=True
+        )
+        template_values, template_counts = np.unique(template_flat, return_counts=True)
+
+    source_quantiles = np.cumsum(source_counts) / source.size
+    template_quantiles = np.cumsum(template_counts) / template.size
+    lut = np.interp(source_quantiles, template_quantiles, template_values)
+    return lut[source_lookup].reshape(source.shape)
+
+
 def match_histograms(
     image_a: np.ndarray, image_b: np.ndarray, kernel_size: int = 7
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -184,9 +703,9 @@ def match_histograms(
         image_b, kernel
     )
     if np.mean(entropy_a) > np.mean(entropy_b):
-        image_b = exposure.match_histograms(image_b, image_a).astype(np.uint8)
+        image_b = _match_cumulative_cdf(image_b, image_a).astype(np.uint8)
     else:
-        image_a = exposure.match_histograms(image_a, image_b).astype(np.uint8)
+        image_a = _match_cumulative_cdf(image_a, image_b).astype(np.uint8)
 
     return image_a, image_b
 
@@ -261,12 +780,37 @@ class DFBRFeatureExtractor(torch.nn.Module):
 
         Returns:
             dict:
-                A dictionary containing the multiscale features.
+                A new dictionary containing the multiscale features.
                 The expected format is {layer_name: features}.
 
         """
         _ = self.pretrained(x)
-        return self.features
+        # Copy the features filled in by the hooks, as the feature
+        # extractor is shared and later calls overwrite them
+        return dict(self.features)
+
+
+@lru_cache(maxsize=None)
+def _get_dfbr_feature_extractor(device: str = "cpu") -> DFBRFeatureExtractor:
+    """Get the DFBR feature extractor.
+
+    The pretrained VGG-16 model is loaded only once per device and
+    shared by all instances of :class:`DFBRegister`.
+
+    Args:
+        device (str):
+            Device on which to place the feature extractor.
+
+    Returns:
+        DFBRFeatureExtractor:
+            A feature extractor in evaluation mode with gradients
+            disabled, using the channels last memory format.
+
+    """
+    feature_extractor = DFBRFeatureExtractor()
+    feature_extractor.eval()
+    feature_extractor.requires_grad_(False)
+    return feature_extractor.to(device, memory_format=torch.channels_last)
 
 
 class DFBRegister:
@@ -286,12 +830,117 @@ class DFBRegister:
         sensing image registration using deep convolutional features.
         Ieee Access, 6, pp.38544-38555.
 
+    Args:
+        patch_size (tuple(int)):
+            Size of the images fed to the feature extractor.
+        mixed_precision (bool):
+            Whether to extract the features in reduced precision,
+            bfloat16 on CPU or float16 on GPU. This is faster on
+            hardware with native support, but the features differ
+            slightly from those in float32.
+        on_gpu (bool):
+            Whether to extract the features on GPU.
+        compile_model (bool):
+            Whether to compile the feature extractor with
+            :func:`torch.compile`. Compiling takes several seconds for
+            each new input shape, so this is only faster when
+            extracting features for many image pairs of the same size.
+            Defaults to False.
+        cuda_graph (bool):
+            Whether to capture the feature extractor forward pass in a
+            CUDA graph when extracting features on GPU, which is
+            replayed for image pairs of the same size. This takes
+            precedence over `compile_model` on GPU and has no effect
+            on CPU. Defaults to False.
+
     """
 
-    def __init__(self, patch_size: Tuple[int, int] = (224, 224)):
+    def __init__(
+        self,
+        patch_size: Tuple[int, int] = (224, 224),
+        mixed_precision: bool = False,
+        on_gpu: bool = False,
+        compile_model: bool = False,
+        cuda_graph: bool = False,
+    ):
         self.patch_size = patch_size
+        self.mixed_precision = mixed_precision
+        self.compile_model = compile_model
+        self.cuda_graph = cuda_graph
+        self.device = select_device(on_gpu)
         self.x_scale, self.y_scale = [], []
-        self.feature_extractor = DFBRFeatureExtractor()
+        self.feature_extractor = _get_dfbr_feature_extractor(self.device)
+        self._compiled_model: Dict[tuple, Callable] = {}
+
+    def _capture_cuda_graph(self, x: torch.Tensor) -> Callable:
+        """Capture the feature extractor forward pass in a CUDA graph.
+
+        Args:
+            x (torch.Tensor):
+                Batch of input images on GPU.
+
+        Returns:
+            Callable:
+                A function which copies its input into the captured
+                input tensor, replays the graph and returns the
+                extracted features.
+
+        """
+        static_input = x.clone()
+        # warm up on a side stream before capturing, as required by CUDA graphs
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                self.feature_extractor(static_input)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_output = dict(self.feature_extractor(static_input))
+
+        def replay(x: torch.Tensor) -> Dict[str, torch.Tensor]:
+            """Replay the captured graph for a new input."""
+            static_input.copy_(x)
+            graph.replay()
+            return {name: feat.clone() for name, feat in static_output.items()}
+
+        return replay
+
+    def _compiled_feature_extractor(self, x: torch.Tensor) -> Callable:
+        """Get the compiled feature extractor for an input batch.
+
+        The first time an input of a given shape and dtype is seen, the
+        forward pass is captured in a CUDA graph if `cuda_graph` is
+        True and the input is on GPU. Otherwise, the feature extractor
+        is compiled with :func:`torch.compile` if `compile_model` is
+        True and :func:`torch.compile` is available. The result is
+        cached for subsequent calls. The eager module is used if
+        neither applies.
+
+        Args:
+            x (torch.Tensor):
+                Batch of input images.
+
+        Returns:
+            Callable:
+                A (possibly compiled) feature extractor.
+
+        """
+        use_cuda_graph = self.cuda_graph and x.is_cuda
+        use_compile = self.compile_model and hasattr(torch, "compile")
+        if not (use_cuda_graph or use_compile):
+            return self.feature_extractor
+        key = (tuple(x.shape), x.dtype)
+        if key not in self._compiled_model:
+            if use_cuda_graph:
+                model = self._capture_cuda_graph(x)
+            else:
+                model = torch.compile(
+                    self.feature_extractor, mode="reduce-overhead", dynamic=False
+                )
+            self._compiled_model[key] = model
+        return self._compiled_model[key]
 
     # Make this function private when full pipeline is implemented.
     def extract_features(
@@ -341,8 +990,22 @@ class DFBRegister:
         moving_cnn = np.expand_dims(moving_cnn, axis=0)
         cnn_input = np.concatenate((fixed_cnn, moving_cnn), axis=0)
 
-        x = torch.from_numpy(cnn_input).type(torch.float32)
-        return self.feature_extractor(x)
+        x = torch.from_numpy(cnn_input).type(torch.float32).to(self.device)
+        x = x.contiguous(memory_format=torch.channels_last)
+        autocast_dtype = torch.bfloat16 if self.device == "cpu" else torch.float16
+        with torch.inference_mode(), torch.autocast(
+            self.device, dtype=autocast_dtype, enabled=self.mixed_precision
+        ):
+            try:
+                features = self._compiled_feature_extractor(x)(x)
+            except TorchDynamoException:
+                # Fall back to eager execution if compilation fails.
+                self._compiled_model[(tuple(x.shape), x.dtype)] = self.feature_extractor
+                features = self.feature_extractor(x)
+
+        if self.mixed_precision:
+            features = {name: feat.float() for name, feat in features.items()}
+        return features
 
     @staticmethod
     def finding_match(feature_dist: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -396,28 +1059,24 @@ class DFBRegister:
                 A feature distance array.
 
         """
-        feature_distance = np.linalg.norm(
-            np.repeat(np.expand_dims(features_x, axis=0), features_y.shape[0], axis=0)
-            - np.repeat(
-                np.expand_dims(features_y, axis=1), features_x.shape[0], axis=1
-            ),
-            axis=len(features_x.shape),
+        # ||x - y||^2 = ||x||^2 + ||y||^2 - 2 x.y, computed with a single
+        # matrix product instead of materialising all pairwise differences
+        features_x = features_x.astype(np.float64)
+        features_y = features_y.astype(np.float64)
+        squared_distance = (
+            np.sum(features_y**2, axis=1)[:, np.newaxis]
+            + np.sum(features_x**2, axis=1)[np.newaxis, :]
+            - 2 * features_y @ features_x.T
         )
+        feature_distance = np.sqrt(np.maximum(squared_distance, 0)).astype(np.float32)
 
-        feature_size_2d = np.int(np.sqrt(feature_distance.shape[0]))
-        ref_feature_size_2d = factor * feature_size_2d
-        feature_size, ref_feature_size = feature_size_2d**2, ref_feature_size_2d**2
+        feature_size_2d = int(np.sqrt(feature_distance.shape[0]))
+        feature_size = feature_size_2d**2
         feature_grid = np.kron(
             np.arange(feature_size).reshape([feature_size_2d, feature_size_2d]),
             np.ones([factor, factor], dtype="int32"),
-        )
-        row_ind = np.repeat(
-            feature_grid.reshape([ref_feature_size, 1]), ref_feature_size, axis=1
-        )
-        col_ind = np.repeat(
-            feature_grid.reshape([1, ref_feature_size]), ref_feature_size, axis=0
-        )
-        return feature_distance[row_ind, col_ind]
+        ).ravel()
+        return feature_distance[np.ix_(feature_grid, feature_grid)]
 
     def feature_mapping(
         self, features: Dict[str, torch.Tensor], num_matching_points: int = 128
@@ -447,9 +1106,9 @@ class DFBRegister:
         if len(features) != 3:
             raise ValueError("The feature mapping step expects 3 blocks of features.")
 
-        pool3_feat = features["block3_pool"].detach().numpy()
-        pool4_feat = features["block4_pool"].detach().numpy()
-        pool5_feat = features["block5_pool"].detach().numpy()
+        pool3_feat = features["block3_pool"].detach().cpu().numpy()
+        pool4_feat = features["block4_pool"].detach().cpu().numpy()
+        pool5_feat = features["block5_pool"].detach().cpu().numpy()
         ref_feature_size = pool3_feat.shape[2]
 
         fixed_feat1 = np.reshape(pool3_feat[0, :, :, :], [-1, 256])
@@ -487,23 +1146,13 @@ class DFBRegister:
             max_quality -= 0.01
 
         matching_points = matching_points[np.where(quality >= max_quality)]
-        count_matching_points = matching_points.shape[0]
 
         fixed_points, moving_points = (
             fixed_points[matching_points[:, 1]],
             moving_points[matching_points[:, 0]],
         )
         feature_dist = feature_dist[
-            np.repeat(
-                np.reshape(matching_points[:, 1], [count_matching_points, 1]),
-                count_matching_points,
-                axis=1,
-            ),
-            np.repeat(
-                np.reshape(matching_points[:, 0], [1, count_matching_points]),
-                count_matching_points,
-                axis=0,
-            ),
+            np.ix_(matching_points[:, 1], matching_points[:, 0])
         ]
 
         fixed_points = ((fixed_points * 224.0) + 112.0) * self.x_scale
@@ -1,11 +1,12 @@
 """Miscellaneous utilities which operate on image data."""
 import warnings
+from functools import lru_cache
 from typing import Tuple, Union
 
+import cv2
 import numpy as np
 from PIL import Image
 
-from tiatoolbox.utils.misc import conv_out_size
 from tiatoolbox.utils.transforms import (
     bounds2locsize,
     bounds2slices,
@@ -22,6 +23,35 @@ applies the padding to the bounds.
 # Make this immutable / non-writable
 PADDING_TO_BOUNDS.flags.writeable = False
 
+# OpenCV border types equivalent to numpy.pad modes
+_CV2_BORDER_TYPES = {
+    "constant": cv2.BORDER_CONSTANT,
+    "edge": cv2.BORDER_REPLICATE,
+    "reflect": cv2.BORDER_REFLECT_101,
+    "symmetric": cv2.BORDER_REFLECT,
+    "wrap": cv2.BORDER_WRAP,
+}
+# For these modes, OpenCV only matches numpy.pad when the padding is at
+# most the region size minus this offset, wider padding is applied in
+# two steps
+_CV2_BORDER_MAX_PADDING_OFFSET = {"reflect": 1, "symmetric": 0, "wrap": 0}
+# Maximum number of channels in an OpenCV array
+_CV2_MAX_CHANNELS = 512
+# Data types supported by cv2.copyMakeBorder, as a set of dtypes for a
+# hashed lookup per region
+_CV2_BORDER_DTYPES = frozenset(
+    np.dtype(dtype)
+    for dtype in (
+        np.uint8,
+        np.int8,
+        np.uint16,
+        np.int16,
+        np.int32,
+        np.float32,
+        np.float64,
+    )
+)
+
 
 def normalize_padding_size(padding):
     """Normalizes padding to be length 4 (left, top, right, bottom).
@@ -47,20 +77,94 @@ def normalize_padding_size(padding):
             left, top, right, bottom.
 
     """
-    padding_shape = np.shape(padding)
-    if len(padding_shape) > 1:
-        raise ValueError(
-            "Invalid input padding shape. Must be scalar or 1 dimensional."
-        )
-    padding_size = np.size(padding)
-    if padding_size == 3:
-        raise ValueError("Padding has invalid size 3. Valid sizes are 1, 2, or 4.")
+    return np.array(_normalize_padding_tuple(padding))
+
+
+def _normalize_padding_tuple(padding):
+    """Normalizes padding to a (left, top, right, bottom) tuple.
+
+    Scalar implementation of :func:`normalize_padding_size`, which
+    returns a tuple of scalars. Integer and tuple of integer inputs
+    are normalized without array operations.
+
+    Args:
+        padding (int or tuple(int)):
+            Padding to normalize.
+
+    Returns:
+        tuple:
+            Padding for left, top, right, bottom.
+
+    """
+    if isinstance(padding, (int, np.integer)):
+        return (padding,) * 4
+    if not (
+        isinstance(padding, (tuple, list))
+        and all(isinstance(p, (int, np.integer)) for p in padding)
+    ):
+        if np.ndim(padding) > 1:
+            raise ValueError(
+                "Invalid input padding shape. Must be scalar or 1 dimensional."
+            )
+        padding = np.ravel(padding)
+    padding = tuple(padding)
+    return _expand_padding(padding, tuple(type(p) for p in padding))
+
+
+def _normalize_stride_tuple(stride):
+    """Normalizes stride to an (x, y) tuple.
+
+    Args:
+        stride (int or tuple(int)):
+            Stride to normalize. A tuple is interpreted as stride in x
+            and y.
+
+    Raises:
+        ValueError:
+            Invalid input size of stride (e.g. length 3).
+
+    Returns:
+        tuple:
+            Stride in x and y.
+
+    """
+    if isinstance(stride, (int, np.integer)):
+        return stride, stride
+    stride = np.ravel(stride)
+    if stride.size not in [1, 2]:
+        raise ValueError("Stride must be of size 1 or 2.")
+    if stride.size == 1:
+        stride = np.tile(stride, 2)
+    return tuple(stride)
+
+
+@lru_cache(maxsize=128)
+def _expand_padding(padding, types):
+    """Expand a tuple of padding to (left, top, right, bottom).
+
+    Results are cached, which is safe as tuples are immutable.
+
+    Args:
+        padding (tuple):
+            Padding of length 1, 2 or 4.
+        types (tuple):
+            Types of the elements of `padding`. Only used as part of
+            the cache key, so that padding which compares equal but has
+            different types, e.g. `(1, 2)` and `(1.0, 2.0)`, is not
+            returned from the same cache entry.
 
-    if padding_size == 1:
-        return np.repeat(padding, 4)
-    if padding_size == 2:
-        return np.tile(padding, 2)
-    return np.array(padding)
+    Returns:
+        tuple:
+            Padding for left, top, right, bottom.
+
+    """
+    if len(padding) == 3:
+        raise ValueError("Padding has invalid size 3. Valid sizes are 1, 2, or 4.")
+    if len(padding) == 1:
+        return padding * 4
+    if len(padding) == 2:
+        return padding * 2
+    return padding
 
 
 def find_padding(read_location, read_size, image_size):
@@ -88,14 +192,13 @@ def find_padding(read_location, read_size, image_size):
         >>> find_padding(location, size, image_size=(5, 5))
 
     """
-    read_location = np.array(read_location)
-    read_size = np.array(read_size)
-    image_size = np.array(image_size)
+    (x, y), (width, height) = read_location, read_size
+    image_width, image_height = image_size
 
-    before_padding = np.maximum(-read_location, 0)
-    region_end = read_location + read_size
-    after_padding = np.maximum(region_end - np.max([image_size, read_location], 0), 0)
-    return np.stack([before_padding[::-1], after_padding[::-1]], axis=1)
+    before_x, before_y = max(-x, 0), max(-y, 0)
+    after_x = max(x + width - max(image_width, x), 0)
+    after_y = max(y + height - max(image_height, y), 0)
+    return np.array([[before_y, after_y], [before_x, after_x]])
 
 
 def find_overlap(read_location, read_size, image_size):
@@ -119,16 +222,18 @@ def find_overlap(read_location, read_size, image_size):
         >>> find_overlap(loc, size, (5, 5))
 
     """
-    read_location = np.array(read_location)
-    read_size = np.array(read_size)
-    image_size = np.array(image_size)
-
-    start = np.maximum(read_location, 0)
-    region_end = read_location + read_size
-    stop = np.minimum(region_end, image_size)
+    (x, y), (width, height) = read_location, read_size
+    image_width, image_height = image_size
 
-    # Concatenate start and stop to make a bounds array (left, top, right, bottom)
-    return np.concatenate([start, stop])
+    # Make a bounds array (left, top, right, bottom) from the start and stop
+    return np.array(
+        [
+            max(x, 0),
+            max(y, 0),
+            min(x + width, image_width),
+            min(y + height, image_height),
+        ]
+    )
 
 
 def make_bounds_size_positive(bounds):
@@ -171,6 +276,273 @@ def make_bounds_size_positive(bounds):
     return (bounds, fliplr, flipud)
 
 
+def _copy_to_out(region, out):
+    """Copy an image region into an output buffer, if one is given.
+
+    Args:
+        region (:class:`numpy.ndarray`):
+            Image region to copy.
+        out (:class:`numpy.ndarray`):
+            Output buffer with the same shape and dtype as `region`, or
+            None.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            `out` containing a copy of the region, or `region` if `out`
+            is None.
+
+    """
+    if out is None:
+        return region
+    _validate_out(out, region.shape, region.dtype)
+    np.copyto(out, region)
+    return out
+
+
+def _validate_out(out, shape, dtype):
+    """Check an output buffer has the expected shape and dtype.
+
+    Args:
+        out (:class:`numpy.ndarray`):
+            Output buffer.
+        shape (tuple(int)):
+            Expected shape.
+        dtype (:class:`numpy.dtype`):
+            Expected dtype.
+
+    Raises:
+        ValueError:
+            Output buffer has an incorrect shape or dtype.
+
+    """
+    shape = tuple(int(x) for x in shape)
+    if out.shape != shape or out.dtype != dtype:
+        raise ValueError(
+            f"Output buffer must have shape {shape} and dtype {dtype}, "
+            f"got {out.shape} and {out.dtype}."
+        )
+
+
+def _pad_constant(region, pad_width, constant_value, out=None):
+    """Pad the height and width of a region with a scalar constant.
+
+    Gives the same output as :func:`numpy.pad` with `mode="constant"`,
+    but fills a preallocated output and copies the region in once
+    rather than going through the staged construction of
+    :func:`numpy.pad`.
+
+    Args:
+        region (:class:`numpy.ndarray`):
+            Image region to pad.
+        pad_width (tuple):
+            Padding in the format expected by :func:`numpy.pad`, i.e.
+            `((top, bottom), (left, right), ...)`. Only the first two
+            axes are padded.
+        constant_value (int or float):
+            Value to fill the padding with.
+        out (:class:`numpy.ndarray`):
+            Optional output buffer to write the padded region to. Must
+            have the padded shape and the same dtype as `region`.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            Padded image region.
+
+    """
+    (top, bottom), (left, right) = pad_width[:2]
+    height, width = region.shape[:2]
+    padded_shape = (top + height + bottom, left + width + right) + region.shape[2:]
+    if out is None:
+        out = np.empty(padded_shape, dtype=region.dtype)
+    else:
+        _validate_out(out, padded_shape, region.dtype)
+    # Cast the same way as np.full
+    np.copyto(out, constant_value, casting="unsafe")
+    out[top : top + height, left : left + width] = region
+    return out
+
+
+def _can_pad_with_cv2(region, pad_width, pad_mode, constant_value, out=None):
+    """Check if :func:`cv2.copyMakeBorder` can pad a region like numpy.pad.
+
+    This is the case for the modes, dtypes and numbers of channels
+    which OpenCV supports, and when OpenCV is faster than the
+    alternatives.
+
+    Args:
+        region (:class:`numpy.ndarray`):
+            Image region to pad.
+        pad_width (tuple):
+            Padding in the format expected by :func:`numpy.pad`.
+        pad_mode (str):
+            The pad mode to use, see :func:`numpy.pad` for valid pad
+            modes.
+        constant_value (int or float):
+            Scalar value to pad with in constant mode.
+        out (:class:`numpy.ndarray`):
+            Optional output buffer to write the padded region to.
+
+    Returns:
+        bool:
+            True if the region can be padded with
+            :func:`cv2.copyMakeBorder`.
+
+    """
+    if (
+        pad_mode not in _CV2_BORDER_TYPES
+        or region.dtype not in _CV2_BORDER_DTYPES
+        or region.ndim not in (2, 3)
+        or region.size == 0
+        or np.any(pad_width[2:])
+        or (out is not None and not out.flags.c_contiguous)
+    ):
+        return False
+    if pad_mode == "constant":
+        # OpenCV copies regions which are not packed along each row,
+        # e.g. strided reads, before padding. For constant padding a
+        # single pass fill and copy from the strided view is faster.
+        packed_rows = region.strides[-1] == region.itemsize and (
+            region.ndim == 2 or region.strides[1] == region.itemsize * region.shape[2]
+        )
+        # OpenCV only accepts a constant value for up to 4 channels,
+        # and rounds and saturates the constant value
+        return bool(
+            packed_rows
+            and (region.ndim == 2 or region.shape[2] <= 4)
+            and np.asarray(constant_value).astype(region.dtype) == constant_value
+        )
+    if region.ndim == 3 and region.shape[2] > _CV2_MAX_CHANNELS:
+        return False
+    # Reflecting modes pad in steps of the region size minus the
+    # offset, which is only faster than numpy.pad for up to two steps
+    max_padding_offset = _CV2_BORDER_MAX_PADDING_OFFSET.get(pad_mode)
+    if max_padding_offset is None:
+        return True
+    (top, bottom), (left, right) = pad_width[:2]
+    height, width = region.shape[:2]
+    return max(top, bottom) <= 2 * (height - max_padding_offset) and max(
+        left, right
+    ) <= 2 * (width - max_padding_offset)
+
+
+def _pad_region(region, pad_width, pad_mode, out=None, **pad_kwargs):
+    """Pad the height and width of an image region.
+
+    Gives the same output as :func:`numpy.pad`, but uses
+    :func:`cv2.copyMakeBorder` where it is equivalent, which is
+    considerably faster. Otherwise falls back to :func:`_pad_constant`
+    or :func:`numpy.pad`, e.g. for unsupported modes, dtypes or keyword
+    arguments, or for reflecting modes with padding more than twice the
+    region size.
+
+    Args:
+        region (:class:`numpy.ndarray`):
+            Image region to pad.
+        pad_width (tuple):
+            Padding in the format expected by :func:`numpy.pad`, i.e.
+            `((top, bottom), (left, right), ...)`. Any padding after
+            the first two axes must be zero.
+        pad_mode (str):
+            The pad mode to use, see :func:`numpy.pad` for valid pad
+            modes.
+        out (:class:`numpy.ndarray`):
+            Optional output buffer to write the padded region to. Must
+            have the padded shape and the same dtype as `region`.
+        **pad_kwargs (dict):
+            Arbitrary keyword arguments passed through to
+            :func:`numpy.pad`.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            Padded image region.
+
+    """
+    constant_values = pad_kwargs.get("constant_values", 0)
+    # Only a scalar constant value for constant mode, or no keyword
+    # arguments for other modes, can be handled without numpy.pad
+    scalar_kwargs = (
+        pad_mode == "constant" and pad_kwargs.keys() <= {"constant_values"}
+    ) or not pad_kwargs
+    scalar_kwargs = scalar_kwargs and np.ndim(constant_values) == 0
+    if scalar_kwargs and _can_pad_with_cv2(
+        region, pad_width, pad_mode, constant_values, out
+    ):
+        (top, bottom), (left, right) = pad_width[:2]
+        return _pad_region_cv2(
+            region, (top, bottom, left, right), pad_mode, constant_values, out
+        )
+    if pad_mode == "constant" and scalar_kwargs:
+        return _pad_constant(region, pad_width, constant_values, out=out)
+    return _copy_to_out(np.pad(region, pad_width, mode=pad_mode, **pad_kwargs), out)
+
+
+def _pad_region_cv2(region, padding, pad_mode, constant_value, out=None):
+    """Pad the height and width of an image region with OpenCV.
+
+    For reflecting modes, OpenCV only matches :func:`numpy.pad` when
+    the padding is at most the region size (minus one for reflect).
+    Wider padding is applied in steps, in the same way as
+    :func:`numpy.pad`, with each step reflecting the region padded so
+    far.
+
+    Args:
+        region (:class:`numpy.ndarray`):
+            Image region to pad.
+        padding (tuple(int)):
+            Padding in (top, bottom, left, right) format.
+        pad_mode (str):
+            The pad mode to use, one of the keys of `_CV2_BORDER_TYPES`.
+        constant_value (int or float):
+            Value to pad with in constant mode.
+        out (:class:`numpy.ndarray`):
+            Optional C contiguous output buffer to write the padded
+            region to.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            Padded image region.
+
+    """
+    top, bottom, left, right = (int(p) for p in padding)
+    border_type = _CV2_BORDER_TYPES[pad_mode]
+    max_padding_offset = _CV2_BORDER_MAX_PADDING_OFFSET.get(pad_mode)
+    if max_padding_offset is not None:
+        height, width = region.shape[:2]
+        while (
+            max(top, bottom) > height - max_padding_offset
+            or max(left, right) > width - max_padding_offset
+        ):
+            step_t, step_b = (
+                min(p, height - max_padding_offset) for p in (top, bottom)
+            )
+            step_l, step_r = (min(p, width - max_padding_offset) for p in (left, right))
+            height, width = height + step_t + step_b, width + step_l + step_r
+            region = cv2.copyMakeBorder(
+                region, step_t, step_b, step_l, step_r, border_type
+            ).reshape((height, width) + region.shape[2:])
+            top, bottom = top - step_t, bottom - step_b
+            left, right = left - step_l, right - step_r
+
+    height, width = region.shape[:2]
+    padded_shape = (top + height + bottom, left + width + right) + region.shape[2:]
+    if out is not None:
+        _validate_out(out, padded_shape, region.dtype)
+    padded = cv2.copyMakeBorder(
+        region,
+        top,
+        bottom,
+        left,
+        right,
+        border_type,
+        dst=out,
+        value=(constant_value,) * 4,
+    )
+    if out is not None:
+        return out
+    # OpenCV drops a singleton channel axis
+    return padded.reshape(padded_shape)
+
+
 def crop_and_pad_edges(
     bounds: Tuple[int, int, int, int],
     max_dimensions: Tuple[int, int],
@@ -226,42 +598,86 @@ def crop_and_pad_edges(
         ... )
 
     """
-    loc, size = bounds2locsize(bounds)
+    left, top, right, bottom = bounds
+    width, height = right - left, bottom - top
+    slide_width, slide_height = max_dimensions
 
-    if np.min(max_dimensions) < 0:
+    if min(slide_width, slide_height) < 0:
         raise ValueError("Max dimensions must be >= 0.")
 
-    if np.min(size) <= 0:
+    if min(width, height) <= 0:
         raise ValueError("Bounds must have size (width and height) > 0.")
 
-    padding = find_padding(loc, size, max_dimensions)
-    if len(region.shape) > 2:
-        padding = np.concatenate([padding, [[0, 0]]])
+    # Find the padding required on each side with scalar arithmetic,
+    # clipped to the bounds size for regions entirely outside the slide
+    x_before, y_before = min(max(-left, 0), width), min(max(-top, 0), height)
+    x_after = max(right - max(slide_width, left), 0)
+    y_after = max(bottom - max(slide_height, top), 0)
 
     # If no padding is required then return the original image unmodified
-    if np.all(np.array(padding) == 0):
+    if not (x_before or y_before or x_after or y_after):
         return region
 
-    overlap = find_overlap(loc, size, max_dimensions)
-    overlap = np.maximum(overlap - np.tile(loc, 2), 0)
-
-    # Add extra padding dimension for colour channels
-    if len(region.shape) > 2:
-        padding = padding + ((0, 0),)
-
-    # Crop the region
-    slices = bounds2slices(overlap)
-    slices += (...,)
-    crop = region[slices]
+    # Crop the region to the part which overlaps the slide
+    x_end = max(min(right, slide_width) - left, 0)
+    y_end = max(min(bottom, slide_height) - top, 0)
+    crop = region[int(y_before) : int(y_end), int(x_before) : int(x_end), ...]
 
     # Return if pad_mode is None
     if pad_mode in ["none", None]:
         return crop
 
+    padding = [(y_before, y_after), (x_before, x_after)]
+    # Add extra padding dimension for colour channels
+    if len(region.shape) > 2:
+        padding += [(0, 0)]
+
     # Pad the region and return
     if pad_mode == "constant":
-        return np.pad(crop, padding, mode=pad_mode, constant_values=pad_constant_values)
-    return np.pad(crop, padding, mode=pad_mode)
+        return _pad_region(crop, padding, pad_mode, constant_values=pad_constant_values)
+    return _pad_region(crop, padding, pad_mode)
+
+
+def _pad_unstrided_region(
+    region, padded_bounds, read_bounds, stride, pad_mode, out=None, **pad_kwargs
+):
+    """Pad a region read without a stride and then apply the stride.
+
+    Args:
+        region (:class:`numpy.ndarray`):
+            Region of the image within `read_bounds`, read with a stride
+            of 1.
+        padded_bounds (tuple(int)):
+            Padded bounds of the output in (left, top, right, bottom)
+            format.
+        read_bounds (tuple(int)):
+            Bounds of `region` in (left, top, right, bottom) format.
+        stride (tuple(int)):
+            Stride in x and y.
+        pad_mode (str):
+            The pad mode to use, see :func:`numpy.pad` for valid pad
+            modes.
+        out (:class:`numpy.ndarray`):
+            Optional output buffer to write the strided region to.
+        **pad_kwargs (dict):
+            Arbitrary keyword arguments passed through to :func:`numpy.pad`.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            Padded and strided region.
+
+    """
+    padded_left, padded_top, padded_right, padded_bottom = padded_bounds
+    read_left, read_top, read_right, read_bottom = read_bounds
+    x_stride, y_stride = stride
+    pad_width = [
+        (read_top - padded_top, padded_bottom - read_bottom),
+        (read_left - padded_left, padded_right - read_right),
+    ]
+    if len(region.shape) == 3:
+        pad_width += [(0, 0)]
+    padded = _pad_region(region, pad_width, pad_mode, **pad_kwargs)
+    return _copy_to_out(padded[::y_stride, ::x_stride, ...], out)
 
 
 def safe_padded_read(
@@ -272,6 +688,7 @@ def safe_padded_read(
     pad_mode="constant",
     pad_constant_values=0,
     pad_kwargs=None,
+    out=None,
 ):
     """Read a region of a numpy array with padding applied to edges.
 
@@ -284,6 +701,11 @@ def safe_padded_read(
     Note that padding of the output is not guaranteed to be
     integer/pixel aligned if using a stride != 1.
 
+    Regions which lie within the image, including strided reads, are
+    returned as a view of `image` without copying. Use
+    :func:`numpy.ascontiguousarray` or :meth:`numpy.ndarray.copy` if a
+    contiguous or independent array is required.
+
     .. figure:: ../images/out_of_bounds_read.png
             :width: 512
             :alt: Illustration for reading a region with negative
@@ -311,16 +733,24 @@ def safe_padded_read(
         pad_kwargs (dict):
             Arbitrary keyword arguments passed through to the padding
             function :func:`numpy.pad`.
+        out (:class:`numpy.ndarray`):
+            Optional output buffer to write the region to, e.g. to
+            reuse the same memory when reading many regions. Must have
+            the shape of the output region and the same dtype as
+            `image`. Defaults to None, allocating a new array (or
+            returning a view) for each read.
 
     Returns:
         :class:`numpy.ndarray`:
-            Padded image region.
+            Padded image region, or `out` if given.
 
     Raises:
         ValueError:
             Bounds must be integers.
         ValueError:
             Padding can't be negative.
+        ValueError:
+            Output buffer has an incorrect shape or dtype.
 
     Examples:
         >>> bounds = (-5, -5, 5, 5)
@@ -338,75 +768,91 @@ def safe_padded_read(
     if pad_mode == "constant" and "constant_values" not in pad_kwargs:
         pad_kwargs["constant_values"] = pad_constant_values
 
-    padding = np.array(padding)
     # Ensure the bounds are integers.
-    if not issubclass(np.array(bounds).dtype.type, (int, np.integer)):
+    if not all(isinstance(x, (int, np.integer)) for x in bounds):
         raise ValueError("Bounds must be integers.")
 
-    if np.any(padding < 0):
-        raise ValueError("Padding cannot be negative.")
-
     # Allow padding to be a 2-tuple in addition to an int or 4-tuple
-    padding = normalize_padding_size(padding)
+    padding = _normalize_padding_tuple(padding)
+
+    if min(padding) < 0:
+        raise ValueError("Padding cannot be negative.")
 
     # Ensure stride is a 2-tuple
-    if np.size(stride) not in [1, 2]:
-        raise ValueError("Stride must be of size 1 or 2.")
-    if np.size(stride) == 1:
-        stride = np.tile(stride, 2)
-    x_stride, y_stride = stride
+    x_stride, y_stride = _normalize_stride_tuple(stride)
 
     # Check if the padded coords are outside the image bounds
     # (over the width/height or under 0)
-    padded_bounds = bounds + (padding * np.array([-1, -1, 1, 1]))
-    img_size = np.array(image.shape[:2][::-1])
-    hw_limits = np.tile(img_size, 2)  # height/width limits
-    zeros = np.zeros(hw_limits.shape)
-    # If all original bounds are within the bounds
-    padded_over = padded_bounds >= hw_limits
-    padded_under = padded_bounds < zeros
+    pad_left, pad_top, pad_right, pad_bottom = padding
+    left, top, right, bottom = bounds
+    padded_left, padded_top = left - pad_left, top - pad_top
+    padded_right, padded_bottom = right + pad_right, bottom + pad_bottom
+    height, width = image.shape[:2]
     # If all padded coords are within the image then read normally
-    if not any(padded_over | padded_under):
-        l, t, r, b = padded_bounds
-        return image[t:b:y_stride, l:r:x_stride, ...]
-    # Else find the closest coordinates which are inside the image
-    clamped_bounds = np.max([np.min([padded_bounds, hw_limits], axis=0), zeros], axis=0)
-    clamped_bounds = np.round(clamped_bounds).astype(int)
-    # Read the area within the image
-    l, t, r, b = clamped_bounds
-    region = image[t:b:y_stride, l:r:x_stride, ...]
-    # Reduce bounds an img_size for the stride
-    if not np.all(np.isin(stride, [None, 1])):
-        # This if is not required but avoids unnecessary calculations
-        bounds = conv_out_size(np.array(bounds), stride=np.tile(stride, 2))
-        padded_bounds = bounds + (padding * np.array([-1, -1, 1, 1]))
-        img_size = conv_out_size(img_size, stride=stride)
+    if (
+        padded_left >= 0
+        and padded_top >= 0
+        and padded_right <= width
+        and padded_bottom <= height
+    ):
+        rows = slice(padded_top, padded_bottom, y_stride)
+        cols = slice(padded_left, padded_right, x_stride)
+        return _copy_to_out(image[rows, cols, ...], out)
+    # Else find the closest coordinates which are inside the image and
+    # read the area within the image
+    read_left, read_right = (
+        round(min(max(x, 0), width)) for x in (padded_left, padded_right)
+    )
+    read_top, read_bottom = (
+        round(min(max(y, 0), height)) for y in (padded_top, padded_bottom)
+    )
 
     # Return without padding if pad_mode is none
     if pad_mode in ["none", None]:
-        return region
-
-    # Find how much padding needs to be applied to fill the edge gaps
-    before_padding = np.min([[0, 0], padded_bounds[2:]], axis=0)
-    after_padding = np.max([img_size, padded_bounds[:2] - img_size], axis=0)
-    edge_padding = padded_bounds - np.concatenate([before_padding, after_padding])
-    edge_padding[:2] = np.min([edge_padding[:2], [0, 0]], axis=0)
-    edge_padding[2:] = np.max([edge_padding[2:], [0, 0]], axis=0)
-    edge_padding = np.abs(edge_padding)
-    l, t, r, b = edge_padding
-    pad_width = [(t, b), (l, r)]
+        rows = slice(read_top, read_bottom, y_stride)
+        cols = slice(read_left, read_right, x_stride)
+        return _copy_to_out(image[rows, cols, ...], out)
+
+    # Size of the output, as if the padded bounds were read from an
+    # image extending infinitely in all directions
+    output_width = int((padded_right - padded_left - 1) // x_stride + 1)
+    output_height = int((padded_bottom - padded_top - 1) // y_stride + 1)
+    # Find how many strided samples lie before the image edge. These
+    # are filled by padding, which is clipped to the output size for
+    # regions entirely outside the image.
+    x_gap = max(-padded_left, 0)
+    y_gap = max(-padded_top, 0)
+    x_before = int(min(-(-x_gap // x_stride), output_width))
+    y_before = int(min(-(-y_gap // y_stride), output_height))
+    # Read from the first strided sample inside the image, so that the
+    # region stays on the same sampling grid as the padded bounds
+    rows = slice(padded_top + y_before * y_stride, read_bottom, y_stride)
+    cols = slice(padded_left + x_before * x_stride, read_right, x_stride)
+    region = image[rows, cols, ...]
+    if pad_mode != "constant" and 0 in region.shape[:2]:
+        # No strided samples lie inside the image, so pad the region
+        # read without a stride instead to have image data to pad from
+        return _pad_unstrided_region(
+            image[read_top:read_bottom, read_left:read_right, ...],
+            (padded_left, padded_top, padded_right, padded_bottom),
+            (read_left, read_top, read_right, read_bottom),
+            (x_stride, y_stride),
+            pad_mode,
+            out=out,
+            **pad_kwargs,
+        )
+    # Pad after the region up to the output size, so that the output has
+    # the same shape as a read which is within the image
+    x_after = output_width - x_before - region.shape[1]
+    y_after = output_height - y_before - region.shape[0]
+    pad_width = [(y_before, y_after), (x_before, x_after)]
     if len(region.shape) == 3:
         pad_width += [(0, 0)]
     # Pad the image region at the edges
-    return np.pad(
-        region,
-        pad_width,
-        mode=pad_mode,
-        **pad_kwargs,
-    )
+    return _pad_region(region, pad_width, pad_mode, out=out, **pad_kwargs)
 
 
-def sub_pixel_read(  # noqa: CCR001
+def sub_pixel_read(
     image,
     bounds,
     output_size,
@@ -480,7 +926,11 @@ def sub_pixel_read(  # noqa: CCR001
 
     Returns:
         :class:`numpy.ndimage`:
-            Output image region.
+            Output image region. If the bounds have a negative width or
+            height, the output is flipped horizontally or vertically
+            respectively. The flip is a view with a negative stride, so
+            use :func:`numpy.ascontiguousarray` if contiguous data is
+            required.
 
     Raises:
         ValueError:
@@ -524,6 +974,244 @@ def sub_pixel_read(  # noqa: CCR001
         ...     return np.array(pil_img.convert("RGB"))
         >>> sub_pixel_read(bounds, read_func=openslide_read)
 
+    """
+    return sub_pixel_read_batch(
+        image,
+        [bounds],
+        output_size if output_size is None else [output_size],
+        padding=padding,
+        stride=stride,
+        interpolation=interpolation,
+        pad_at_baseline=pad_at_baseline,
+        interpolation_padding=interpolation_padding,
+        read_func=read_func,
+        pad_mode=pad_mode,
+        pad_constant_values=pad_constant_values,
+        read_kwargs=read_kwargs,
+        pad_kwargs=pad_kwargs,
+    )[0]
+
+
+def _find_padding_batch(bounds, image_size):
+    """Find the padding to add when reading each of a set of regions.
+
+    Vectorised version of :func:`find_padding` for N x 4 bounds.
+
+    Args:
+        bounds (:class:`numpy.ndarray`):
+            N x 4 array of bounds in (left, top, right, bottom) format.
+        image_size (tuple(int)):
+            The size of the image to read from.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            N x 2 x 2 array of padding for each region in the format
+            expected by `np.pad`, i.e. `((before_y, after_y), (before_x,
+            after_x))`.
+
+    """
+    read_location, region_end = bounds[:, :2], bounds[:, 2:]
+    before_padding = np.maximum(-read_location, 0)
+    after_padding = np.maximum(region_end - np.maximum(image_size, read_location), 0)
+    return np.stack([before_padding[:, ::-1], after_padding[:, ::-1]], axis=2)
+
+
+def _find_overlap_batch(bounds, image_size):
+    """Find the part of each of a set of regions which overlaps the image.
+
+    Vectorised version of :func:`find_overlap` for N x 4 bounds.
+
+    Args:
+        bounds (:class:`numpy.ndarray`):
+            N x 4 array of bounds in (left, top, right, bottom) format.
+        image_size (tuple(int)):
+            The size of the image to read from.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            N x 4 array of bounds of the overlapping regions.
+
+    """
+    read_location, region_end = bounds[:, :2], bounds[:, 2:]
+    return np.concatenate(
+        [np.maximum(read_location, 0), np.minimum(region_end, image_size)], axis=1
+    )
+
+
+def _make_bounds_size_positive_batch(bounds):
+    """Make each of a set of bounds have positive size and get flip flags.
+
+    Vectorised version of :func:`make_bounds_size_positive` for N x 4
+    bounds.
+
+    Args:
+        bounds (:class:`numpy.ndarray`):
+            N x 4 array of bounds in (left, top, right, bottom) format.
+
+    Returns:
+        tuple:
+            Three tuple containing positive bounds and flips:
+            - :class:`numpy.ndarray` - N x 4 positive bounds
+            - :class:`numpy.ndarray` - N horizontal flips
+            - :class:`numpy.ndarray` - N vertical flips
+
+    """
+    negative_size = bounds[:, 2:] < bounds[:, :2]
+    fliplr, flipud = negative_size.T
+    if not np.any(negative_size):
+        return bounds, fliplr, flipud
+    bounds = np.where(np.tile(negative_size, 2), bounds[:, [2, 3, 0, 1]], bounds)
+    return bounds, fliplr, flipud
+
+
+def _resize_and_trim(
+    region, scale_factor, scaled_size, trimming, output_size, interpolation
+):
+    """Resize an image region and trim it to the output size.
+
+    Rounding can make the trimmed region differ from the output size
+    by a pixel. Rather than resizing again to correct this, the region
+    is resized once to a size which trims to exactly the output size.
+    This makes one pass over the output with one interpolation, rather
+    than resizing, copying the trimmed region and interpolating again.
+
+    Args:
+        region (:class:`numpy.ndarray`):
+            Image region to resize.
+        scale_factor (:class:`numpy.ndarray`):
+            Scaling factor to resize the region by.
+        scaled_size (:class:`numpy.ndarray`):
+            Size of the region after scaling, (width, height).
+        trimming (tuple(slice)):
+            Slices to trim from the scaled region, (rows, columns).
+        output_size (:class:`numpy.ndarray`):
+            Size of the output region, (width, height).
+        interpolation (str):
+            Method of interpolation, see :func:`sub_pixel_read`.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            Resized image region.
+
+    """
+    # Only trim if the scale is one and the trimmed region has the
+    # output size, e.g. for integer bounds with the same output size
+    if np.all(scale_factor == 1):
+        trimmed_region = region[trimming + (...,)]
+        if np.array_equal(trimmed_region.shape[1::-1], output_size):
+            return trimmed_region
+
+    # Start and stop of the trimmed region for x and y
+    trim_ranges = [
+        trim.indices(size)[:2] for trim, size in zip(trimming[::-1], scaled_size)
+    ]
+    trimmed_bounds = np.array(trim_ranges).T.flatten()
+    trimmed_size = trimmed_bounds[2:] - trimmed_bounds[:2]
+    # Resize by the scale factor and trim if this gives the output size.
+    # Also do so for empty sizes, which can't be scaled between, and for
+    # "optimise", which picks the interpolation from the scale factor.
+    trims_to_output = np.array_equal(trimmed_size, output_size)
+    empty_size = np.min(trimmed_size) <= 0 or np.min(output_size) <= 0
+    if trims_to_output or empty_size or interpolation == "optimise":
+        region = imresize(
+            region, scale_factor=scale_factor, interpolation=interpolation
+        )
+        region = region[trimming + (...,)]
+        if not np.array_equal(region.shape[1::-1], output_size):
+            region = imresize(
+                region, output_size=tuple(output_size), interpolation=interpolation
+            )
+        return region
+
+    # Resize so that the trimmed region has the output size, keeping
+    # the amount trimmed from each side
+    trimmed_bounds[2:] = trimmed_bounds[:2] + output_size
+    resized_size = scaled_size + output_size - trimmed_size
+    region = imresize(
+        region,
+        output_size=tuple(int(x) for x in resized_size),
+        interpolation=interpolation,
+    )
+    return region[bounds2slices(trimmed_bounds) + (...,)]
+
+
+def sub_pixel_read_batch(  # noqa: CCR001
+    image,
+    bounds,
+    output_size,
+    padding=0,
+    stride=1,
+    interpolation="nearest",
+    pad_at_baseline=False,
+    interpolation_padding=2,
+    read_func=None,
+    pad_mode="constant",
+    pad_constant_values=0,
+    read_kwargs=None,
+    pad_kwargs=None,
+):
+    """Read and resize a batch of image regions with sub-pixel bounds.
+
+    Batched version of :func:`sub_pixel_read`. The geometry for all of
+    the regions (scaling, padding, integer read bounds and residuals)
+    is computed at once, so that only reading, padding and resizing
+    are done for each region in turn. This reduces the per region
+    overhead when reading many small regions, e.g. patches.
+
+    Args:
+        image (:class:`numpy.ndarray`):
+            Image to read from.
+        bounds (:class:`numpy.ndarray`):
+            N x 4 array of bounds of the regions to read in (left, top,
+            right, bottom) format.
+        output_size (:class:`numpy.ndarray`):
+            N x 2 array of the desired output sizes, or a single output
+            size to use for all regions.
+        padding (int or tuple(int)):
+            Amount of padding to apply to each image region in pixels.
+            Defaults to 0.
+        stride (int or tuple(int)):
+            Stride when reading from img. Defaults to 1. A tuple is
+            interpreted as stride in x and y (axis 1 and 0
+            respectively).
+        interpolation (str):
+            Method of interpolation. Possible values are: nearest,
+            linear, cubic, lanczos, area. Defaults to nearest.
+        pad_at_baseline (bool):
+            Apply padding in terms of baseline pixels. Defaults to
+            False, meaning padding is added to the output image size in
+            pixels.
+        interpolation_padding (int):
+            Padding to temporarily apply before rescaling to avoid
+            border effects. Defaults to 2.
+        read_func (collections.abc.Callable):
+            Custom read function. See :func:`sub_pixel_read`.
+        pad_mode (str):
+            Method for padding when reading areas are outside the input
+            image. See :func:`sub_pixel_read`.
+        pad_constant_values (int, tuple(int)): Constant values to use
+            when padding with constant pad mode. Passed to the
+            :func:`numpy.pad` `constant_values` argument. Default is 0.
+        **read_kwargs (dict):
+            Arbitrary keyword arguments passed through to `read_func`.
+        **pad_kwargs (dict):
+            Arbitrary keyword arguments passed through to the padding
+            function :func:`numpy.pad`.
+
+    Returns:
+        list(:class:`numpy.ndarray`):
+            Output image regions, one for each row of `bounds`.
+            Regions with a negative width or height are flipped as in
+            :func:`sub_pixel_read`.
+
+    Raises:
+        ValueError:
+            Invalid arguments.
+
+    Examples:
+        >>> bounds = np.array([[0, 0, 10.5, 10.5], [5.5, 5.5, 16, 16]])
+        >>> regions = sub_pixel_read_batch(image, bounds, output_size=(8, 8))
+
     """
     # Handle inputs
     if pad_kwargs is None:
@@ -536,7 +1224,9 @@ def sub_pixel_read(  # noqa: CCR001
     if pad_mode == "constant" and "constant_values" not in pad_kwargs:
         pad_kwargs["constant_values"] = pad_constant_values
 
-    if 0 in bounds2locsize(bounds)[1]:
+    bounds = np.reshape(bounds, (-1, 4))
+    bounds_size = bounds[:, 2:] - bounds[:, :2]
+    if np.any(bounds_size == 0):
         raise ValueError("Bounds must have non-zero size")
 
     # Normalize padding
@@ -545,9 +1235,10 @@ def sub_pixel_read(  # noqa: CCR001
     # Check the bounds are valid or have a negative size
     # The left/start_x and top/start_y values should usually be smaller
     # than the right/end_x and bottom/end_y values.
-    bounds, fliplr, flipud = make_bounds_size_positive(bounds)
-    if fliplr or flipud:
+    bounds, fliplr, flipud = _make_bounds_size_positive_batch(bounds)
+    if np.any(fliplr) or np.any(flipud):
         warnings.warn("Bounds have a negative size, output will be flipped.")
+        bounds_size = np.abs(bounds_size)
 
     if isinstance(image, Image.Image):
         image = np.array(image)
@@ -558,108 +1249,102 @@ def sub_pixel_read(  # noqa: CCR001
 
     # Initialise variables
     image_size = np.flip(image.shape[:2])
-    scaling = np.array([1, 1])
-    _, bounds_size = bounds2locsize(bounds)
+    scaling = np.ones_like(bounds_size, dtype=int)
     if output_size is not None and interpolation != "none":
-        scaling = np.array(output_size) / bounds_size / stride
+        scaling = np.broadcast_to(output_size, bounds_size.shape) / bounds_size / stride
     read_bounds = bounds
+    overlap_bounds = _find_overlap_batch(bounds, image_size)
     if pad_mode is None:
-        output_size = np.round(
-            bounds2locsize(find_overlap(*bounds2locsize(bounds), image_size))[1]
-            * scaling
-        ).astype(int)
-
-    overlap_bounds = find_overlap(*bounds2locsize(bounds), image_size=image_size)
-    if pad_mode is None:
+        overlap_size = overlap_bounds[:, 2:] - overlap_bounds[:, :2]
+        output_size = np.round(overlap_size * scaling).astype(int)
         read_bounds = overlap_bounds
-    pad_width = np.zeros((2, 2), int)
+    if output_size is not None:
+        output_size = np.broadcast_to(output_size, bounds_size.shape)
 
     baseline_padding = padding
     if not pad_at_baseline:
         baseline_padding = padding * np.tile(scaling, 2)
 
     # Check the padded bounds do not have zero size
-    _, padded_bounds_size = bounds2locsize(pad_bounds(bounds, baseline_padding))
-    if 0 in padded_bounds_size:
+    padded_bounds = bounds + baseline_padding * PADDING_TO_BOUNDS
+    if np.any(padded_bounds[:, 2:] - padded_bounds[:, :2] == 0):
         raise ValueError("Bounds have zero size after padding.")
 
-    read_bounds = pad_bounds(read_bounds, interpolation_padding + baseline_padding)
-    # 0 Expand to integers and find residuals
-    start, end = np.reshape(read_bounds, (2, -1))
+    # 0 Pad the bounds, expand to integers and find residuals
+    read_bounds = read_bounds + (
+        (interpolation_padding + baseline_padding) * PADDING_TO_BOUNDS
+    )
     int_read_bounds = np.concatenate(
-        [
-            np.floor(start),
-            np.ceil(end),
-        ]
+        [np.floor(read_bounds[:, :2]), np.ceil(read_bounds[:, 2:])], axis=1
     )
     residuals = np.abs(int_read_bounds - read_bounds)
     read_bounds = int_read_bounds
-    valid_int_bounds = find_overlap(
-        *bounds2locsize(int_read_bounds), image_size
-    ).astype(int)
-
-    # 1 Read the region
-    _, valid_int_size = bounds2locsize(valid_int_bounds)
-    if read_func is None:
-        region = image[bounds2slices(valid_int_bounds, stride=stride)]
-    else:
-        region = read_func(image, valid_int_bounds, stride, **read_kwargs)
-        if region is None or 0 in region.shape:
-            raise ValueError("Read region is empty or None.")
-        region_size = region.shape[:2][::-1]
-        if not np.array_equal(region_size, valid_int_size):
-            raise ValueError("Read function returned a region of incorrect size.")
-
-    # 1.5 Pad the region
-    pad_width = find_padding(*bounds2locsize(read_bounds), image_size=image_size)
+    valid_int_bounds = _find_overlap_batch(int_read_bounds, image_size).astype(int)
+
+    # Find the padding to apply after reading
+    pad_width = _find_padding_batch(read_bounds, image_size)
     if pad_mode is None:
-        pad_width -= find_padding(*bounds2locsize(overlap_bounds), image_size)
+        pad_width -= _find_padding_batch(overlap_bounds, image_size)
     # Apply stride to padding
-    pad_width = pad_width / stride
-    # Add 0 padding to channels if required
-    if len(image.shape) > 2:
-        pad_width = np.concatenate([pad_width, [(0, 0)]])
-    # 1.7 Do the padding
-    if pad_mode == "constant":
-        region = np.pad(
-            region,
-            pad_width.astype(int),
-            mode=pad_mode or "constant",
-            **pad_kwargs,
-        )
-    else:
-        region = np.pad(region, pad_width.astype(int), mode=pad_mode or "constant")
-    # 2 Re-scaling
-    if output_size is not None and interpolation != "none":
-        region = imresize(region, scale_factor=scaling, interpolation=interpolation)
-    # 3 Trim interpolation padding
-    region_size = np.flip(region.shape[:2])
-    trimming = bounds2slices(
-        np.round(
-            pad_bounds(
-                locsize2bounds((0, 0), region_size),
-                (-(interpolation_padding + residuals) * np.tile(scaling, 2)),
+    pad_width = (pad_width / stride).astype(int)
+
+    total_padding_per_axis = padding.reshape(2, 2).sum(axis=0)
+    rescale = output_size is not None and interpolation != "none"
+
+    regions = []
+    for i, valid_int_bounds_i in enumerate(valid_int_bounds):
+        # 1 Read the region
+        if read_func is None:
+            region = image[bounds2slices(valid_int_bounds_i, stride=stride)]
+        else:
+            region = read_func(image, valid_int_bounds_i, stride, **read_kwargs)
+            if region is None or 0 in region.shape:
+                raise ValueError("Read region is empty or None.")
+            region_size = region.shape[:2][::-1]
+            valid_int_size = valid_int_bounds_i[2:] - valid_int_bounds_i[:2]
+            if not np.array_equal(region_size, valid_int_size):
+                raise ValueError("Read function returned a region of incorrect size.")
+
+        # 1.5 Pad the region
+        pad_width_i = pad_width[i]
+        # Add 0 padding to channels if required
+        if len(image.shape) > 2:
+            pad_width_i = np.concatenate([pad_width_i, [(0, 0)]])
+        if pad_mode == "constant":
+            region = np.pad(region, pad_width_i, mode=pad_mode, **pad_kwargs)
+        else:
+            region = np.pad(region, pad_width_i, mode=pad_mode or "constant")
+        # 2 Re-scaling
+        region_size = np.flip(region.shape[:2])
+        scaled_size = region_size
+        if rescale and not np.all(scaling[i] == 1):
+            scaled_size = (region_size * scaling[i]).astype(int)
+        # 3 Trim interpolation padding
+        trimming = bounds2slices(
+            np.round(
+                pad_bounds(
+                    locsize2bounds((0, 0), scaled_size),
+                    (-(interpolation_padding + residuals[i]) * np.tile(scaling[i], 2)),
+                )
             )
         )
-    )
-    region = region[trimming + (...,)]
-    region_size = region.shape[:2][::-1]
-    # 4 Ensure output is the correct size
-    if output_size is not None and interpolation != "none":
-        total_padding_per_axis = padding.reshape(2, 2).sum(axis=0)
-        if pad_at_baseline:
-            output_size = np.round(
-                np.add(output_size, total_padding_per_axis * scaling)
-            ).astype(int)
-        else:
-            output_size = np.add(output_size, total_padding_per_axis)
-        if not np.array_equal(region_size, output_size):
-            region = imresize(
-                region, output_size=tuple(output_size), interpolation=interpolation
+        # 4 Ensure output is the correct size
+        if rescale:
+            if pad_at_baseline:
+                output_size_i = np.round(
+                    np.add(output_size[i], total_padding_per_axis * scaling[i])
+                ).astype(int)
+            else:
+                output_size_i = np.add(output_size[i], total_padding_per_axis)
+            region = _resize_and_trim(
+                region, scaling[i], scaled_size, trimming, output_size_i, interpolation
             )
-    # 5 Apply flips to account for negative bounds
-    if fliplr:
-        region = np.flipud(region)
-    if flipud:
-        region = np.fliplr(region)
-    return region  # noqa: R504
+        else:
+            region = region[trimming + (...,)]
+        # 5 Apply flips to account for negative bounds, as views
+        if fliplr[i]:
+            region = region[:, ::-1]
+        if flipud[i]:
+            region = region[::-1]
+        regions.append(region)
+    return regions
@@ -132,8 +132,10 @@ def imresize(img, scale_factor=None, output_size=None, interpolation="optimise")
             f"Does not support resizing for array of dtype: {original_dtype}"
         )
 
+    # Avoid copying the image if it is already of the converted type,
+    # e.g. uint8 and float32 which cv2.resize has optimised code for
     converted_dtype = dtype_mapping[source_dtypes.index(original_dtype)][1]
-    img = img.astype(converted_dtype)
+    img = img.astype(converted_dtype, copy=False)
 
     interpolation = parse_cv2_interpolaton(interpolation)
 